@@ -406,11 +406,19 @@ class SonarQubeIntegration(CodeQualityBase):
             temp.token = token
             temp.project_key = project_key
             temp.enabled = True
-            metrics = temp.get_project_metrics()
-            if metrics:
+            # Lightweight credential check before touching project measures
+            auth = temp._api_request("/authentication/validate")
+            result = None
+            if auth and auth.get("valid"):
+                result = temp._api_request("/measures/component", {
+                    "component": project_key,
+                    "metricKeys": "ncloc"
+                })
+            if result:
                 typer.secho(f"   Connected to project: {project_key}", fg=typer.colors.GREEN)
-                if "ncloc" in metrics:
-                    typer.echo(f"   Lines of code: {metrics['ncloc']}")
+                for measure in result.get("component", {}).get("measures", []):
+                    if measure.get("metric") == "ncloc":
+                        typer.echo(f"   Lines of code: {measure.get('value')}")
             else:
                 typer.secho("   Failed to connect or project not found", fg=typer.colors.RED)
         return config_values
\ No newline at end of file
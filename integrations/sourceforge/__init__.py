@@ -5,6 +5,7 @@ Code hosting with repository management on SourceForge.
 """
 
 import os
+import re
 import subprocess
 from typing import Optional, Dict, List
 
@@ -24,6 +25,19 @@ except ImportError:
         def get_default_branch(self): return "master"
 
 
+# SourceForge remote URL formats:
+#   ssh://username@git.code.sf.net/p/project/code
+#   https://git.code.sf.net/p/project/code
+#   git://git.code.sf.net/p/project/code
+#   username@git.code.sf.net:p/project/code  (scp-style)
+#   https://sourceforge.net/p/project/code
+_SF_RE = re.compile(
+    r"(?:[a-z][a-z0-9+.-]*://)?(?:[^@/]+@)?(?:[\w.-]+\.)?(?:sf|sourceforge)\.net"
+    r"(?::\d+)?[:/]/?p/(?P<project>[^/?#]+)(?:/(?P<repo>[^/?#]+?))?(?:\.git)?/?(?:[?#].*)?$",
+    re.IGNORECASE
+)
+
+
 class SourceForgeIntegration(CodeHostingBase):
     """SourceForge code hosting integration
 
@@ -79,18 +93,11 @@ class SourceForgeIntegration(CodeHostingBase):
                 capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0:
-                url = result.stdout.strip()
-                # Parse SourceForge URL formats:
-                # ssh://username@git.code.sf.net/p/project/code
-                # https://git.code.sf.net/p/project/code
-                # git://git.code.sf.net/p/project/code
-                if "sf.net" in url or "sourceforge" in url.lower():
-                    if "/p/" in url:
-                        parts = url.split("/p/")[-1].split("/")
-                        if len(parts) >= 1:
-                            self.project = self.project or parts[0]
-                        if len(parts) >= 2:
-                            self.repo_path = parts[1].replace(".git", "")
+                match = _SF_RE.match(result.stdout.strip())
+                if match:
+                    self.project = self.project or match["project"]
+                    if match["repo"]:
+                        self.repo_path = match["repo"]
         except Exception:
             pass
 
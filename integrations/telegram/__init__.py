@@ -7,10 +7,13 @@ Supports interactive features: inline keyboards, polls, and webhooks.
 
 import os
 import json
+import time
+import queue
+import atexit
+import threading
+import requests
+from functools import lru_cache, partial
 from typing import Optional, Dict, List, Any
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
-from urllib.parse import quote
 
 try:
     from redgit.integrations.base import NotificationBase, IntegrationType
@@ -30,6 +33,110 @@ except ImportError:
         def get_capabilities(self): return {}
 
 
+try:
+    import typer
+except ImportError:
+    typer = None
+
+try:
+    from redgit.core.actions import ActionRegistry, ActionContext
+    _HAS_ACTIONS = True
+except ImportError:
+    ActionRegistry = ActionContext = None
+    _HAS_ACTIONS = False
+
+
+# Max messages waiting on the background worker before new ones are dropped
+_MAX_PENDING = 1000
+
+# How many times the background worker retries a rate-limited (429) send
+_MAX_RETRIES = 3
+
+# Upper bound in seconds on how long flush() waits for queued sends
+_FLUSH_TIMEOUT = 30
+
+# Compact UTF-8 JSON request bodies, via orjson when it is installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _JSON_DUMP = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps(obj: Any) -> bytes:
+        return _JSON_DUMP(obj).encode("utf-8")
+
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_MD_ESCAPE = str.maketrans({c: "\\" + c for c in "_*`["})
+_MD2_ESCAPE = str.maketrans({c: "\\" + c for c in "\\_*[]()~`>#+-=|{}.!"})
+# Inside the (...) part of a MarkdownV2 link only ')' and '\' are special
+_MD2_URL_ESCAPE = str.maketrans({c: "\\" + c for c in "\\)"})
+
+# First characters a JSON value can start with (object, array, string, number, literal)
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+_EVENT_EMOJIS = {
+    "commit": "\U0001F528",      # Hammer
+    "branch": "\U0001F331",      # Seedling
+    "pr": "\U0001F500",          # Twisted arrows
+    "task": "\U0001F4CB",        # Clipboard
+    "deploy": "\U0001F680",      # Rocket
+    "alert": "\U000026A0",       # Warning
+    "message": "\U0001F4AC",     # Speech balloon
+}
+
+_LEVEL_ICONS = {
+    "info": "\U0001F535",      # Blue circle
+    "success": "\U00002705",   # Check mark
+    "warning": "\U000026A0",   # Warning
+    "error": "\U0000274C",     # X mark
+}
+
+
+@lru_cache(maxsize=1024)
+def _escape_html(text: str) -> str:
+    """Escape HTML special characters (cached, titles and field keys repeat)."""
+    return text.translate(_HTML_ESCAPE)
+
+
+@lru_cache(maxsize=1024)
+def _escape_md(text: str) -> str:
+    """Escape legacy Markdown special characters."""
+    return text.translate(_MD_ESCAPE)
+
+
+@lru_cache(maxsize=1024)
+def _escape_md2(text: str) -> str:
+    """Escape MarkdownV2 special characters."""
+    return text.translate(_MD2_ESCAPE)
+
+
+def _escape_md2_url(url: str) -> str:
+    """Escape a URL for the (...) part of a MarkdownV2 inline link."""
+    return url.translate(_MD2_URL_ESCAPE)
+
+
+# parse_mode -> (escape, bold, italic, link, link url escape) with (open, close) markup pairs
+_MARKUP = {
+    "HTML": (_escape_html, ("<b>", "</b>"), ("<i>", "</i>"), ('<a href="', '">View Details</a>'), str),
+    "Markdown": (_escape_md, ("*", "*"), ("_", "_"), ("[View Details](", ")"), str),
+    "MarkdownV2": (_escape_md2, ("*", "*"), ("_", "_"), ("[View Details](", ")"), _escape_md2_url),
+    None: (str, ("", ""), ("", ""), ("View Details: ", ""), str),
+}
+
+
+def _parse_callback_payload(payload_str: str) -> Any:
+    """Parse callback JSON, wrapping non-JSON data as ``{"raw": ...}``."""
+    # Skip the parser for plain-text button data
+    if payload_str.lstrip()[:1] not in _JSON_START_CHARS:
+        return {"raw": payload_str}
+    try:
+        return json.loads(payload_str)
+    except json.JSONDecodeError:
+        return {"raw": payload_str}
+
+
 class TelegramIntegration(NotificationBase):
     """Telegram notification integration via Bot API"""
 
@@ -48,17 +155,46 @@ class TelegramIntegration(NotificationBase):
         self.bot_token = ""
         self.chat_id = ""
         self.parse_mode = "HTML"
+        self._markup = _MARKUP["HTML"]
+        self.session = None
+        self._base_url = ""
+        self._send_url = ""
+        self._send_prefix = b""
+        self._queue = None
+        self._worker = None
 
     def setup(self, config: dict):
         """Setup Telegram bot."""
         self.bot_token = config.get("bot_token") or os.getenv("TELEGRAM_BOT_TOKEN", "")
         self.chat_id = config.get("chat_id") or os.getenv("TELEGRAM_CHAT_ID", "")
         self.parse_mode = config.get("parse_mode", "HTML")
+        self._markup = _MARKUP.get(self.parse_mode, _MARKUP["HTML"])
 
         if not self.bot_token or not self.chat_id:
             self.enabled = False
             return
 
+        # Keep-alive session shared by every Bot API call
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        self._base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._send_url = f"{self._base_url}/sendMessage"
+        self._send_prefix = (
+            b'{"chat_id":' + _dumps(self.chat_id)
+            + b',"parse_mode":' + _dumps(self.parse_mode)
+            + b',"disable_web_page_preview":false,"text":'
+        )
+
+        # Optionally deliver send_message/notify from a single worker thread;
+        # setup() may run again, so start it (and the exit flush) only once
+        if config.get("background_send", False) and self._worker is None:
+            self._queue = queue.Queue(maxsize=_MAX_PENDING)
+            self._worker = threading.Thread(
+                target=self._drain, args=(self._queue,), name="tg-sender", daemon=True
+            )
+            self._worker.start()
+            atexit.register(self.flush)
+
         self.enabled = True
 
     def send_message(self, message: str, channel: str = None) -> bool:
@@ -67,7 +203,7 @@ class TelegramIntegration(NotificationBase):
             return False
 
         chat_id = channel or self.chat_id
-        return self._send_message(chat_id, message)
+        return self._dispatch(chat_id, message)
 
     def notify(
         self,
@@ -83,89 +219,120 @@ class TelegramIntegration(NotificationBase):
         if not self.enabled:
             return False
 
-        emojis = {
-            "commit": "\U0001F528",      # Hammer
-            "branch": "\U0001F331",      # Seedling
-            "pr": "\U0001F500",          # Twisted arrows
-            "task": "\U0001F4CB",        # Clipboard
-            "deploy": "\U0001F680",      # Rocket
-            "alert": "\U000026A0",       # Warning
-            "message": "\U0001F4AC",     # Speech balloon
-        }
-        emoji = emojis.get(event_type, "\U0001F514")  # Bell
+        emoji = _EVENT_EMOJIS.get(event_type, "\U0001F514")  # Bell
+        level_icon = _LEVEL_ICONS.get(level, "")
 
-        level_icons = {
-            "info": "\U0001F535",      # Blue circle
-            "success": "\U00002705",   # Check mark
-            "warning": "\U000026A0",   # Warning
-            "error": "\U0000274C",     # X mark
-        }
-        level_icon = level_icons.get(level, "")
-
-        # Build message
-        lines = [f"{emoji} <b>{self._escape_html(title)}</b>"]
+        # Build message in the markup of the configured parse_mode
+        escape, (b_open, b_close), (i_open, i_close), (a_open, a_close), escape_url = self._markup
+        parts = [emoji, " ", b_open, escape(title), b_close]
 
         if message:
-            lines.append(f"\n{self._escape_html(message)}")
+            parts += ("\n\n", escape(message))
 
         if fields:
-            lines.append("")
+            parts.append("\n")
             for k, v in fields.items():
-                lines.append(f"<b>{self._escape_html(k)}:</b> {self._escape_html(str(v))}")
+                parts += ("\n", b_open, escape(k), ":", b_close, " ", escape(str(v)))
 
         if url:
-            lines.append(f"\n<a href=\"{url}\">View Details</a>")
+            parts += ("\n\n", a_open, escape_url(url), a_close)
 
-        lines.append(f"\n{level_icon} <i>via RedGit</i>")
+        parts += ("\n\n", level_icon, " ", i_open, "via RedGit", i_close)
 
-        text = "\n".join(lines)
+        text = "".join(parts)
         chat_id = channel or self.chat_id
 
-        return self._send_message(chat_id, text)
+        return self._dispatch(chat_id, text)
 
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+    def _dispatch(self, chat_id: str, text: str) -> bool:
+        """Send now, or queue for the background worker when enabled.
+
+        In background mode the return value only says whether the message
+        was queued; it is dropped when too many sends are already pending.
+        """
+        if self._queue is None:
+            return self._send_message(chat_id, text)
+
+        try:
+            self._queue.put_nowait((chat_id, text))
+            return True
+        except queue.Full:
+            return False
+
+    def flush(self, timeout: float = _FLUSH_TIMEOUT) -> bool:
+        """Wait until all queued background messages have been sent.
+
+        Gives up after ``timeout`` seconds so exit never hangs on a stalled
+        worker. Returns False if messages were still pending.
+        """
+        q = self._queue
+        if q is None:
+            return True
+
+        deadline = time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+
+    def _drain(self, q: "queue.Queue"):
+        """Background worker: send queued messages in order, honouring 429s."""
+        while True:
+            chat_id, text = q.get()
+            try:
+                for attempt in range(1, _MAX_RETRIES + 1):
+                    response = self._post_message(chat_id, text)
+                    if response is None or response.status_code != 429:
+                        break
+                    # Out of attempts: don't stall the queue waiting for nothing
+                    if attempt == _MAX_RETRIES:
+                        break
+                    retry_after = response.json().get("parameters", {}).get("retry_after")
+                    if not retry_after:
+                        break
+                    time.sleep(retry_after)
+            except Exception:
+                # A bad response must not kill the worker and strand the queue
+                pass
+            finally:
+                q.task_done()
 
     def _send_message(self, chat_id: str, text: str) -> bool:
         """Send message via Telegram Bot API."""
+        response = self._post_message(chat_id, text)
+        # Only success matters here, so skip decoding the echoed message
+        return response is not None and b'"ok":true' in response.content
+
+    def _post_message(self, chat_id: str, text: str) -> Optional["requests.Response"]:
+        """POST to sendMessage and return the raw response."""
         try:
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-            payload = {
-                "chat_id": chat_id,
-                "text": text,
-                "parse_mode": self.parse_mode,
-                "disable_web_page_preview": False
-            }
-            data = json.dumps(payload).encode("utf-8")
-            req = Request(
-                url,
-                data=data,
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
-            with urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result.get("ok", False)
-        except (HTTPError, URLError):
-            return False
+            if chat_id == self.chat_id:
+                # Default chat: only the text needs encoding
+                data = self._send_prefix + _dumps(text) + b"}"
+            else:
+                data = _dumps({
+                    "chat_id": chat_id,
+                    "text": text,
+                    "parse_mode": self.parse_mode,
+                    "disable_web_page_preview": False
+                })
+            return self.session.post(self._send_url, data=data, timeout=10)
+        except requests.RequestException:
+            return None
 
     @staticmethod
     def after_install(config_values: dict) -> dict:
-        import typer
+        if typer is None:
+            return config_values
         bot_token = config_values.get("bot_token", "")
         chat_id = config_values.get("chat_id", "")
         if bot_token and chat_id:
             typer.echo("\n   Testing Telegram bot...")
             temp = TelegramIntegration()
-            temp.bot_token = bot_token
-            temp.chat_id = chat_id
-            temp.parse_mode = "HTML"
-            temp.enabled = True
+            temp.setup({"bot_token": bot_token, "chat_id": chat_id, "parse_mode": "HTML"})
             if temp.send_message("\U00002705 RedGit connected successfully!"):
                 typer.secho("   Test message sent!", fg=typer.colors.GREEN)
             else:
@@ -200,54 +367,41 @@ class TelegramIntegration(NotificationBase):
 
         chat_id = channel or self.chat_id
 
-        # Build inline keyboard
-        keyboard = []
-        if buttons:
-            row = []
-            for btn in buttons:
-                if "url" in btn:
-                    # URL button
-                    row.append({
-                        "text": btn["text"],
-                        "url": btn["url"]
-                    })
-                else:
-                    # Callback button
-                    action = btn.get("action", "unknown")
-                    data = btn.get("data", {})
-                    callback_data = f"{action}:{json.dumps(data, separators=(',', ':'))}"
-
-                    # Telegram callback_data has 64 byte limit
-                    if len(callback_data) > 64:
-                        callback_data = callback_data[:64]
-
-                    row.append({
-                        "text": btn["text"],
-                        "callback_data": callback_data
-                    })
-
-                # Max 8 buttons per row, start new row
-                if len(row) >= 3:
-                    keyboard.append(row)
-                    row = []
-
-            if row:
-                keyboard.append(row)
-
         payload = {
             "chat_id": chat_id,
             "text": message,
             "parse_mode": self.parse_mode
         }
 
-        if keyboard:
-            payload["reply_markup"] = {"inline_keyboard": keyboard}
+        # Build inline keyboard, max 3 buttons per row
+        if buttons:
+            built = [self._build_button(btn) for btn in buttons]
+            payload["reply_markup"] = {
+                "inline_keyboard": [built[i:i + 3] for i in range(0, len(built), 3)]
+            }
 
         result = self._api_call("sendMessage", payload)
         if result and result.get("ok"):
             return str(result.get("result", {}).get("message_id"))
         return None
 
+    @staticmethod
+    def _build_button(btn: Dict[str, Any]) -> Dict[str, str]:
+        """Convert a button definition to a Telegram inline keyboard button."""
+        if "url" in btn:
+            return {"text": btn["text"], "url": btn["url"]}
+
+        action = btn.get("action", "unknown")
+        data = btn.get("data", {})
+        callback_data = f"{action}:{json.dumps(data, separators=(',', ':'))}"
+
+        # Telegram callback_data has a 64 byte (not character) limit
+        encoded = callback_data.encode("utf-8")
+        if len(encoded) > 64:
+            callback_data = encoded[:64].decode("utf-8", errors="ignore")
+
+        return {"text": btn["text"], "callback_data": callback_data}
+
     def send_poll(
         self,
         question: str,
@@ -280,7 +434,7 @@ class TelegramIntegration(NotificationBase):
         payload = {
             "chat_id": chat_id,
             "question": question[:300],
-            "options": json.dumps(options),
+            "options": options,
             "is_anonymous": anonymous,
             "allows_multiple_answers": allows_multiple
         }
@@ -306,37 +460,31 @@ class TelegramIntegration(NotificationBase):
         # Parse callback data
         if ":" in data:
             action, payload_str = data.split(":", 1)
-            try:
-                payload = json.loads(payload_str)
-            except json.JSONDecodeError:
-                payload = {"raw": payload_str}
+            payload = _parse_callback_payload(payload_str)
         else:
             action = data
             payload = {}
 
-        # Execute action via ActionRegistry if available
-        try:
-            from redgit.core.actions import ActionRegistry, ActionContext
-
-            context = ActionContext(
-                user_id=str(callback_data.get("from", {}).get("id", "")),
-                message_id=str(callback_data.get("message", {}).get("message_id", "")),
-                chat_id=str(callback_data.get("message", {}).get("chat", {}).get("id", "")),
-                integration="telegram",
-                raw_data=callback_data
-            )
+        if not _HAS_ACTIONS:
+            # RedGit not available, just acknowledge
+            self._answer_callback(callback_id, f"Action: {action}")
+            return None
 
-            result = ActionRegistry.execute(action, payload, context)
+        # Execute action via ActionRegistry
+        context = ActionContext(
+            user_id=str(callback_data.get("from", {}).get("id", "")),
+            message_id=str(callback_data.get("message", {}).get("message_id", "")),
+            chat_id=str(callback_data.get("message", {}).get("chat", {}).get("id", "")),
+            integration="telegram",
+            raw_data=callback_data
+        )
 
-            # Answer callback query
-            self._answer_callback(callback_id, result.message or ("Done!" if result.success else result.error))
+        result = ActionRegistry.execute(action, payload, context)
 
-            return result.message
+        # Answer callback query
+        self._answer_callback(callback_id, result.message or ("Done!" if result.success else result.error))
 
-        except ImportError:
-            # RedGit not available, just acknowledge
-            self._answer_callback(callback_id, f"Action: {action}")
-            return None
+        return result.message
 
     def setup_webhook(self, url: str) -> bool:
         """
@@ -355,7 +503,7 @@ class TelegramIntegration(NotificationBase):
 
         payload = {
             "url": webhook_url,
-            "allowed_updates": json.dumps(["callback_query", "poll_answer"])
+            "allowed_updates": ["callback_query", "poll_answer"]
         }
 
         result = self._api_call("setWebhook", payload)
@@ -374,7 +522,7 @@ class TelegramIntegration(NotificationBase):
         if not self.enabled:
             return None
 
-        result = self._api_call("getWebhookInfo", {}, method="GET")
+        result = self._api_call("getWebhookInfo", {}, method_type="GET")
         if result and result.get("ok"):
             return result.get("result")
         return None
@@ -387,17 +535,16 @@ class TelegramIntegration(NotificationBase):
     ) -> Optional[Dict[str, Any]]:
         """Make a Telegram Bot API call."""
         try:
-            url = f"https://api.telegram.org/bot{self.bot_token}/{method}"
-            data = json.dumps(payload).encode("utf-8")
-            req = Request(
+            url = f"{self._base_url}/{method}"
+            data = _dumps(payload)
+            response = self.session.request(
+                method_type,
                 url,
                 data=data if method_type == "POST" else None,
-                headers={"Content-Type": "application/json"},
-                method=method_type
+                timeout=10
             )
-            with urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError):
+            return response.json()
+        except (requests.RequestException, ValueError):
             return None
 
     def _answer_callback(self, callback_id: str, text: str = None, show_alert: bool = False):
@@ -5,22 +5,28 @@ Manage builds, trigger jobs, view status and logs.
 """
 
 import os
-import json
+import time
 import subprocess
-from typing import Optional, Dict, List, Any
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+import requests
+from itertools import islice
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, List, Any, Tuple
 
 try:
     from redgit.integrations.base import CICDBase, IntegrationType, PipelineRun, PipelineJob
 except ImportError:
+    import sys
     from enum import Enum
     from dataclasses import dataclass
 
+    _SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
     class IntegrationType(Enum):
         CI_CD = "ci_cd"
 
-    @dataclass
+    @dataclass(**_SLOTS)
     class PipelineRun:
         id: str
         name: str
@@ -33,7 +39,7 @@ except ImportError:
         duration: Optional[int] = None
         trigger: Optional[str] = None
 
-    @dataclass
+    @dataclass(**_SLOTS)
     class PipelineJob:
         id: str
         name: str
@@ -52,6 +58,30 @@ except ImportError:
         def setup(self, config): pass
 
 
+# JSON encode/decode, via orjson when it is installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Repo slug detected from the git remote, per working directory
+_REMOTE_SLUG_CACHE: Dict[str, str] = {}
+
+# Rough size of a log line, used to turn a line count into a byte Range
+_APPROX_LOG_LINE_BYTES = 200
+
+# Seconds a list_pipelines result is reused for identical arguments
+_LIST_CACHE_TTL = 5.0
+
+
 class TravisCIIntegration(CICDBase):
     """Travis CI integration"""
 
@@ -78,11 +108,37 @@ class TravisCIIntegration(CICDBase):
         },
     }
 
+    # Travis state -> standard status
+    STATUS_MAP = {
+        "created": "pending",
+        "received": "pending",
+        "started": "running",
+        "passed": "success",
+        "failed": "failed",
+        "errored": "failed",
+        "canceled": "cancelled",
+        "booting": "pending"
+    }
+
+    # Standard status -> Travis state filter
+    REVERSE_STATUS_MAP = {
+        "pending": "created",
+        "running": "started",
+        "success": "passed",
+        "failed": "failed",
+        "cancelled": "canceled"
+    }
+
     def __init__(self):
         super().__init__()
         self.token = ""
         self.repo_slug = ""  # owner/repo
+        self._encoded_slug = ""
         self._api_base = "https://api.travis-ci.com"  # .com for private, .org for public
+        self.session = None
+        self._current_branch = None
+        self._list_cache: Dict[tuple, Tuple[float, List[PipelineRun]]] = {}
+        self._etags: Dict[str, Tuple[str, dict]] = {}
 
     def setup(self, config: dict):
         """Setup Travis CI integration."""
@@ -97,31 +153,58 @@ class TravisCIIntegration(CICDBase):
 
         if not self.repo_slug:
             self._detect_from_remote()
+        self._encoded_slug = quote(self.repo_slug, safe="")
 
         if not self.token:
             self.enabled = False
             return
 
+        # Keep-alive connection pool shared by every API call
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self.session.headers.update({
+            "Authorization": f"token {self.token}",
+            "Travis-API-Version": "3",
+            "Content-Type": "application/json"
+        })
         self.enabled = True
 
     def _detect_from_remote(self):
         """Detect repo slug from git remote."""
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                if "github.com" in url:
-                    if url.startswith("git@"):
-                        path = url.split(":")[-1].replace(".git", "")
-                    else:
-                        path = "/".join(url.replace(".git", "").split("/")[-2:])
-                    if path:
-                        self.repo_slug = path
-        except Exception:
-            pass
+        key = os.getcwd()
+        if key not in _REMOTE_SLUG_CACHE:
+            path = ""
+            try:
+                result = subprocess.run(
+                    ["git", "remote", "get-url", "origin"],
+                    capture_output=True, text=True, timeout=5
+                )
+                if result.returncode == 0:
+                    url = result.stdout.strip()
+                    if "github.com" in url:
+                        if url.startswith("git@"):
+                            path = url.split(":")[-1].replace(".git", "")
+                        else:
+                            path = "/".join(url.replace(".git", "").split("/")[-2:])
+            except Exception:
+                pass
+            _REMOTE_SLUG_CACHE[key] = path
+
+        if _REMOTE_SLUG_CACHE[key]:
+            self.repo_slug = _REMOTE_SLUG_CACHE[key]
+
+    def _detect_branch(self) -> str:
+        """Detect the checked-out branch once per instance."""
+        if self._current_branch is None:
+            try:
+                result = subprocess.run(
+                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                    capture_output=True, text=True, timeout=5
+                )
+                self._current_branch = result.stdout.strip() if result.returncode == 0 else "main"
+            except Exception:
+                self._current_branch = "main"
+        return self._current_branch
 
     def _api_request(
         self,
@@ -129,54 +212,47 @@ class TravisCIIntegration(CICDBase):
         method: str = "GET",
         data: dict = None
     ) -> Optional[dict]:
-        """Make Travis CI API request."""
+        """Make Travis CI API request.
+
+        GET responses carrying an ETag are remembered so repeat requests
+        can be answered with 304 Not Modified and served from memory.
+        """
+        url = f"{self._api_base}{endpoint}"
+        cached = self._etags.get(url) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            url = f"{self._api_base}{endpoint}"
-            headers = {
-                "Authorization": f"token {self.token}",
-                "Travis-API-Version": "3",
-                "Content-Type": "application/json"
-            }
+            response = self.session.request(
+                method,
+                url,
+                data=_dumps(data) if data else None,
+                headers=headers,
+                timeout=30
+            )
+        except requests.RequestException:
+            return None
 
-            req_data = None
-            if data:
-                req_data = json.dumps(data).encode("utf-8")
-
-            req = Request(url, data=req_data, headers=headers, method=method)
-
-            with urlopen(req, timeout=30) as response:
-                content = response.read().decode("utf-8")
-                if content:
-                    return json.loads(content)
-                return {}
-        except HTTPError as e:
-            if e.code == 404:
-                return None
-            raise
-        except URLError:
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code == 404:
             return None
+        response.raise_for_status()
+
+        result = _loads(response.content) if response.content else {}
+        etag = response.headers.get("ETag")
+        if method == "GET" and etag:
+            self._etags[url] = (etag, result)
+        return result
 
     def _map_status(self, state: str) -> str:
         """Map Travis state to standard status."""
-        status_map = {
-            "created": "pending",
-            "received": "pending",
-            "started": "running",
-            "passed": "success",
-            "failed": "failed",
-            "errored": "failed",
-            "canceled": "cancelled",
-            "booting": "pending"
-        }
-        return status_map.get(state, state)
+        return self.STATUS_MAP.get(state, state)
 
     def _build_to_run(self, build: dict) -> PipelineRun:
         """Convert Travis build to PipelineRun."""
+        # Decoded JSON objects are always exact dicts, so skip isinstance
         branch = build.get("branch", {})
-        if isinstance(branch, dict):
-            branch_name = branch.get("name")
-        else:
-            branch_name = branch
+        branch_name = branch.get("name") if type(branch) is dict else branch
 
         commit = build.get("commit", {})
 
@@ -185,7 +261,7 @@ class TravisCIIntegration(CICDBase):
             name=f"Build #{build.get('number', '')}",
             status=self._map_status(build.get("state", "")),
             branch=branch_name,
-            commit_sha=commit.get("sha") if isinstance(commit, dict) else None,
+            commit_sha=commit.get("sha") if type(commit) is dict else None,
             url=f"https://app.travis-ci.com/{self.repo_slug}/builds/{build.get('id')}",
             started_at=build.get("started_at"),
             finished_at=build.get("finished_at"),
@@ -205,14 +281,7 @@ class TravisCIIntegration(CICDBase):
 
         # Get current branch if not specified
         if not branch:
-            try:
-                result = subprocess.run(
-                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                    capture_output=True, text=True, timeout=5
-                )
-                branch = result.stdout.strip() if result.returncode == 0 else "main"
-            except Exception:
-                branch = "main"
+            branch = self._detect_branch()
 
         data = {
             "request": {
@@ -223,11 +292,9 @@ class TravisCIIntegration(CICDBase):
         if inputs:
             data["request"]["config"] = {"env": inputs}
 
-        # URL encode the repo slug
-        encoded_slug = self.repo_slug.replace("/", "%2F")
-
+        self._list_cache.clear()
         result = self._api_request(
-            f"/repo/{encoded_slug}/requests",
+            f"/repo/{self._encoded_slug}/requests",
             method="POST",
             data=data
         )
@@ -268,32 +335,33 @@ class TravisCIIntegration(CICDBase):
         if not self.enabled:
             return []
 
-        encoded_slug = self.repo_slug.replace("/", "%2F")
+        cache_key = (self.repo_slug, branch, status, limit)
+        cached = self._list_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+            return list(cached[1])
+
         params = [f"limit={limit}"]
         if branch:
             params.append(f"branch.name={branch}")
         if status:
-            travis_state = {
-                "pending": "created",
-                "running": "started",
-                "success": "passed",
-                "failed": "failed",
-                "cancelled": "canceled"
-            }.get(status, status)
+            travis_state = self.REVERSE_STATUS_MAP.get(status, status)
             params.append(f"state={travis_state}")
 
         query = "&".join(params)
-        result = self._api_request(f"/repo/{encoded_slug}/builds?{query}")
+        result = self._api_request(f"/repo/{self._encoded_slug}/builds?{query}")
 
+        runs = []
         if result and "builds" in result:
-            return [self._build_to_run(b) for b in result["builds"][:limit]]
-        return []
+            runs = [self._build_to_run(b) for b in islice(result["builds"], limit)]
+        self._list_cache[cache_key] = (time.monotonic(), runs)
+        return list(runs)
 
     def cancel_pipeline(self, run_id: str) -> bool:
         """Cancel a build."""
         if not self.enabled:
             return False
 
+        self._list_cache.clear()
         try:
             self._api_request(f"/build/{run_id}/cancel", method="POST")
             return True
@@ -308,26 +376,46 @@ class TravisCIIntegration(CICDBase):
         result = self._api_request(f"/build/{run_id}/jobs")
 
         if result and "jobs" in result:
-            jobs = []
-            for job in result["jobs"]:
-                jobs.append(PipelineJob(
-                    id=str(job.get("id", "")),
-                    name=job.get("number", ""),
-                    status=self._map_status(job.get("state", "")),
-                    stage=job.get("stage", {}).get("name") if isinstance(job.get("stage"), dict) else None,
-                    started_at=job.get("started_at"),
-                    finished_at=job.get("finished_at"),
-                    duration=job.get("duration"),
-                    url=None
-                ))
-            return jobs
+            return [self._job_to_pipeline_job(job) for job in result["jobs"]]
         return []
 
+    def get_build_with_jobs(self, run_id: str) -> Tuple[Optional[PipelineRun], List[PipelineJob]]:
+        """Fetch a build and its jobs concurrently."""
+        if not self.enabled:
+            return None, []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            build_future = executor.submit(self._api_request, f"/build/{run_id}")
+            jobs_future = executor.submit(self._api_request, f"/build/{run_id}/jobs")
+            build_result = build_future.result()
+            jobs_result = jobs_future.result()
+
+        build = self._build_to_run(build_result) if build_result else None
+        jobs = []
+        if jobs_result and "jobs" in jobs_result:
+            jobs = [self._job_to_pipeline_job(job) for job in jobs_result["jobs"]]
+        return build, jobs
+
+    def _job_to_pipeline_job(self, job: dict) -> PipelineJob:
+        """Convert Travis job to PipelineJob."""
+        stage = job.get("stage")
+        return PipelineJob(
+            id=str(job.get("id", "")),
+            name=job.get("number", ""),
+            status=self._map_status(job.get("state", "")),
+            stage=stage.get("name") if type(stage) is dict else None,
+            started_at=job.get("started_at"),
+            finished_at=job.get("finished_at"),
+            duration=job.get("duration"),
+            url=None
+        )
+
     def retry_pipeline(self, run_id: str) -> Optional[PipelineRun]:
         """Restart a build."""
         if not self.enabled:
             return None
 
+        self._list_cache.clear()
         try:
             result = self._api_request(f"/build/{run_id}/restart", method="POST")
             if result:
@@ -336,18 +424,64 @@ class TravisCIIntegration(CICDBase):
             pass
         return None
 
-    def get_job_log(self, job_id: str) -> Optional[str]:
-        """Get log for a job."""
+    def get_job_log(self, job_id: str, tail: int = None) -> Optional[str]:
+        """Get log for a job.
+
+        With ``tail`` only the end of the log is requested, using an HTTP
+        Range header sized for ``tail`` lines; when that range turns out to
+        hold fewer lines, or the server ignores it, the full log is used.
+        """
         if not self.enabled:
             return None
 
+        headers = {"Accept": "text/plain"}
+        if tail:
+            headers["Range"] = f"bytes=-{tail * _APPROX_LOG_LINE_BYTES}"
+
+        response = self._fetch_job_log(job_id, headers)
+        if response is None or response.status_code != 206:
+            return response.text if response is not None else None
+
+        content = response.text
+        start = self._content_range_start(response)
+        if start == 0:
+            # The range covered the whole log
+            return content
+        if start is not None:
+            # Drop the partial first line of a ranged response
+            content = content.partition("\n")[2]
+            if content.strip().count("\n") + 1 >= tail:
+                return content
+
+        # Long lines: the range held fewer than `tail` lines, refetch it all
+        del headers["Range"]
+        response = self._fetch_job_log(job_id, headers)
+        return response.text if response is not None else None
+
+    def _fetch_job_log(self, job_id: str, headers: dict) -> Optional["requests.Response"]:
+        """GET a job's plain-text log; None on errors and non-2xx statuses."""
         try:
-            result = self._api_request(f"/job/{job_id}/log")
-            if result:
-                return result.get("content", "")
-        except Exception:
-            pass
-        return None
+            response = self.session.get(
+                f"{self._api_base}/job/{job_id}/log.txt",
+                headers=headers,
+                timeout=30
+            )
+        except requests.RequestException:
+            return None
+
+        if response.status_code not in (200, 206):
+            return None
+        return response
+
+    @staticmethod
+    def _content_range_start(response: "requests.Response") -> Optional[int]:
+        """First byte offset from a ``Content-Range: bytes a-b/n`` header."""
+        value = response.headers.get("Content-Range", "")
+        unit, _, spec = value.partition(" ")
+        start = spec.partition("-")[0]
+        if unit.lower() != "bytes" or not start.isdigit():
+            return None
+        return int(start)
 
     @staticmethod
     def after_install(config_values: dict) -> dict:
@@ -356,12 +490,7 @@ class TravisCIIntegration(CICDBase):
         if token:
             typer.echo("\n   Verifying Travis CI token...")
             temp = TravisCIIntegration()
-            temp.token = token
-            temp.repo_slug = config_values.get("repo_slug", "")
-            endpoint = config_values.get("endpoint", "com")
-            temp._api_base = f"https://api.travis-ci.{endpoint}"
-            temp._detect_from_remote()
-            temp.enabled = True
+            temp.setup(config_values)
 
             if temp.repo_slug:
                 config_values["repo_slug"] = temp.repo_slug
@@ -8,8 +8,6 @@ Commands:
 """
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing import Optional
 
 try:
@@ -19,12 +17,27 @@ except ImportError:
     ConfigManager = None
     get_cicd = None
 
-console = Console()
 travis_ci_app = typer.Typer(help="Travis CI management")
+_console = None
+_cached_travis = None
+
+
+def _get_console():
+    """Create the Rich console on first use (keeps rich off the import path)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 def _get_travis():
-    """Get configured Travis CI integration."""
+    """Get configured Travis CI integration (shared for the process)."""
+    global _cached_travis
+    if _cached_travis is not None:
+        return _cached_travis
+
+    console = _get_console()
     if not ConfigManager:
         console.print("[red]RedGit not properly installed.[/red]")
         raise typer.Exit(1)
@@ -37,24 +50,28 @@ def _get_travis():
         console.print("[dim]Run 'rg install travis-ci' to set up[/dim]")
         raise typer.Exit(1)
 
+    _cached_travis = travis
     return travis
 
 
+_STATUS_ICONS = {
+    "success": "[green]✓[/green]",
+    "failed": "[red]✗[/red]",
+    "running": "[yellow]●[/yellow]",
+    "pending": "[blue]○[/blue]",
+    "cancelled": "[dim]⊘[/dim]"
+}
+
+
 def _status_icon(status: str) -> str:
     """Get icon for status."""
-    icons = {
-        "success": "[green]✓[/green]",
-        "failed": "[red]✗[/red]",
-        "running": "[yellow]●[/yellow]",
-        "pending": "[blue]○[/blue]",
-        "cancelled": "[dim]⊘[/dim]"
-    }
-    return icons.get(status, "?")
+    return _STATUS_ICONS.get(status, "?")
 
 
 @travis_ci_app.command("status")
 def status_cmd():
     """Show Travis CI status overview."""
+    console = _get_console()
     travis = _get_travis()
 
     console.print("\n[bold cyan]Travis CI Status[/bold cyan]\n")
@@ -81,6 +98,9 @@ def list_builds(
     limit: int = typer.Option(10, "--limit", "-n", help="Number of builds to show")
 ):
     """List builds."""
+    from rich.table import Table
+
+    console = _get_console()
     travis = _get_travis()
 
     title = "Builds"
@@ -103,29 +123,32 @@ def list_builds(
     table.add_column("Duration", style="dim")
     table.add_column("Trigger", style="dim")
 
-    for b in builds:
-        duration = f"{b.duration}s" if b.duration else "-"
-        table.add_row(
-            b.name,
-            _status_icon(b.status),
-            b.branch or "-",
-            duration,
-            b.trigger or "-"
-        )
+    rows = [
+        (b.name, _status_icon(b.status), b.branch or "-",
+         f"{b.duration}s" if b.duration else "-", b.trigger or "-")
+        for b in builds
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
 
 @travis_ci_app.command("build")
 def show_build(
-    build_id: str = typer.Argument(..., help="Build ID")
+    build_id: str = typer.Argument(..., help="Build ID"),
+    with_jobs: bool = typer.Option(False, "--jobs", "-j", help="Also show the build's jobs")
 ):
     """Show build details."""
+    console = _get_console()
     travis = _get_travis()
 
     console.print(f"\n[bold cyan]Build #{build_id}[/bold cyan]\n")
 
-    build = travis.get_pipeline_status(build_id)
+    if with_jobs:
+        build, jobs = travis.get_build_with_jobs(build_id)
+    else:
+        build, jobs = travis.get_pipeline_status(build_id), []
     if not build:
         console.print("[red]Build not found.[/red]")
         raise typer.Exit(1)
@@ -138,12 +161,21 @@ def show_build(
     if build.url:
         console.print(f"\n   URL: {build.url}")
 
+    if jobs:
+        console.print("\n   [bold]Jobs:[/bold]")
+        for job in jobs:
+            stage = f" ({job.stage})" if job.stage else ""
+            console.print(f"   {_status_icon(job.status)} {job.name}{stage} - {job.status}")
+
 
 @travis_ci_app.command("jobs")
 def show_jobs(
     build_id: str = typer.Argument(..., help="Build ID")
 ):
     """Show jobs for a build."""
+    from rich.table import Table
+
+    console = _get_console()
     travis = _get_travis()
 
     console.print(f"\n[bold cyan]Jobs for Build #{build_id}[/bold cyan]\n")
@@ -159,14 +191,13 @@ def show_jobs(
     table.add_column("Stage")
     table.add_column("Duration", style="dim")
 
-    for job in jobs:
-        duration = f"{job.duration}s" if job.duration else "-"
-        table.add_row(
-            job.name,
-            _status_icon(job.status),
-            job.stage or "-",
-            duration
-        )
+    rows = [
+        (job.name, _status_icon(job.status), job.stage or "-",
+         f"{job.duration}s" if job.duration else "-")
+        for job in jobs
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -176,6 +207,7 @@ def trigger_build(
     branch: Optional[str] = typer.Option(None, "--branch", "-b", help="Branch to build")
 ):
     """Trigger a new build."""
+    console = _get_console()
     travis = _get_travis()
 
     console.print("\n[bold cyan]Triggering Build[/bold cyan]\n")
@@ -198,6 +230,7 @@ def restart_build(
     build_id: str = typer.Argument(..., help="Build ID")
 ):
     """Restart a build."""
+    console = _get_console()
     travis = _get_travis()
 
     console.print(f"\n[bold cyan]Restarting Build #{build_id}[/bold cyan]\n")
@@ -215,6 +248,7 @@ def cancel_build(
     build_id: str = typer.Argument(..., help="Build ID")
 ):
     """Cancel a running build."""
+    console = _get_console()
     travis = _get_travis()
 
     if travis.cancel_pipeline(build_id):
@@ -230,15 +264,16 @@ def show_logs(
     tail: int = typer.Option(50, "--tail", "-n", help="Number of lines to show")
 ):
     """Show job logs."""
+    console = _get_console()
     travis = _get_travis()
 
     console.print(f"\n[bold cyan]Logs for Job #{job_id}[/bold cyan]\n")
 
-    logs = travis.get_job_log(job_id)
+    logs = travis.get_job_log(job_id, tail=tail)
     if logs:
-        lines = logs.strip().split("\n")
-        if tail and len(lines) > tail:
-            lines = lines[-tail:]
+        logs = logs.strip()
+        # rsplit with maxsplit only splits off the last `tail` lines
+        lines = logs.rsplit("\n", tail)[-tail:] if tail else logs.split("\n")
         for line in lines:
             console.print(line)
     else:
@@ -5,26 +5,45 @@ Implements TaskManagementBase for Trello REST API.
 """
 
 import os
-import json
-from typing import Optional, Dict, List, Any
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
+import re
+import time
+import shutil
+import hashlib
+from pathlib import Path
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, List, Any, Tuple
 
 try:
     from redgit.integrations.base import TaskManagementBase, Issue, Sprint, IntegrationType
 except ImportError:
+    import sys
+    from dataclasses import dataclass, field
     from enum import Enum
+    _SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
     class IntegrationType(Enum):
         TASK_MANAGEMENT = "task_management"
+    @dataclass(**_SLOTS)
     class Issue:
-        def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
+        key: str
+        summary: str = ""
+        description: str = ""
+        status: str = ""
+        issue_type: str = ""
+        assignee: Optional[str] = None
+        url: str = ""
+        story_points: Optional[float] = None
+        labels: list = field(default_factory=list)
+    @dataclass(**_SLOTS)
     class Sprint:
-        def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
+        id: str
+        name: str = ""
+        state: str = ""
+        start_date: str = ""
+        end_date: str = ""
+        goal: str = ""
     class TaskManagementBase:
         integration_type = IntegrationType.TASK_MANAGEMENT
         def __init__(self):
@@ -32,6 +51,50 @@ except ImportError:
         def setup(self, config): pass
 
 
+# JSON encode/decode, via orjson when it is installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Board metadata (lists, labels, members) rarely changes during a session
+_METADATA_TTL = 300.0
+_ME_TTL = 60.0
+
+# Authenticated user, persisted between CLI runs so setup can skip members/me
+_ME_CACHE_PATH = Path.home() / ".cache" / "redgit" / "trello_me.json"
+_ME_CACHE_TTL = 86400
+
+# Board metadata persisted between CLI runs, per credentials
+_CACHE_DIR = Path.home() / ".cache" / "redgit" / "trello"
+_BOARD_DISK_TTL = 1800
+_BOARDS_DISK_TTL = 86400
+
+# Only the card fields _parse_card and the callers read
+_CARD_FIELDS = "name,desc,shortUrl,url,idList,idMembers,idBoard,labels"
+
+# Everything str.isalnum() rejects except spaces (\w also admits "_")
+_BRANCH_STRIP_RE = re.compile(r"[^\w ]+|_+")
+
+
+def _write_private(path: Path, data: bytes):
+    """Write a cache file readable only by the current user."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    # The mode only applies on creation; tighten files written before
+    os.chmod(path, 0o600)
+
+
 class TrelloIntegration(TaskManagementBase):
     """Trello integration - Kanban board task management"""
 
@@ -72,11 +135,25 @@ class TrelloIntegration(TaskManagementBase):
         self.token = ""
         self.board_id = ""
         self.project_key = "TRELLO"
+        self._key_prefix = "TRELLO-"
         self.status_map = self.DEFAULT_STATUS_MAP.copy()
         self.branch_pattern = "feature/{issue_id}-{description}"
         self.commit_prefix = ""
         self._me = None
         self._lists = {}
+        self._lists_lower = {}
+        self._list_names = {}
+        self._status_index = {}
+        self._todo_list_id = None
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+
+        # Keep-alive connection pool; idempotent requests retry on 429/5xx
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        ))
 
     def setup(self, config: dict):
         """Setup Trello connection."""
@@ -84,6 +161,7 @@ class TrelloIntegration(TaskManagementBase):
         self.token = config.get("token") or os.getenv("TRELLO_TOKEN", "")
         self.board_id = config.get("board_id", "")
         self.project_key = config.get("project_key", "TRELLO")
+        self._key_prefix = f"{self.project_key}-"
 
         if config.get("statuses"):
             for key, values in config["statuses"].items():
@@ -100,7 +178,14 @@ class TrelloIntegration(TaskManagementBase):
             return
 
         try:
-            me = self._get_me()
+            me = self._read_cached_me()
+            if self.board_id:
+                # Warm the user and board metadata caches in one round trip
+                self._bootstrap(include_me=not me)
+            if not me:
+                me = self._get_me()
+                if me:
+                    self._write_cached_me(me)
             if me:
                 self._me = me
                 self.enabled = True
@@ -122,41 +207,268 @@ class TrelloIntegration(TaskManagementBase):
         if params:
             auth_params.update(params)
 
-        url = f"{self.API_URL}/{endpoint}"
-        if auth_params:
-            url += "?" + urlencode(auth_params)
+        body = _dumps(data) if data and method in ["POST", "PUT"] else None
+        headers = {"Content-Type": "application/json"} if body else None
 
         try:
-            body = json.dumps(data).encode("utf-8") if data and method in ["POST", "PUT"] else None
-            headers = {"Content-Type": "application/json"} if body else {}
+            response = self.session.request(
+                method,
+                f"{self.API_URL}/{endpoint}",
+                params=auth_params,
+                data=body,
+                headers=headers,
+                timeout=30
+            )
+            if not response.ok:
+                if response.status_code == 401:
+                    self._forget_cached_me()
+                return None
+            return _loads(response.content)
+        except (requests.RequestException, ValueError):
+            return None
 
-            req = Request(url, data=body, headers=headers, method=method)
-            with urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (HTTPError, URLError, json.JSONDecodeError):
+    def _cached_request(
+        self,
+        endpoint: str,
+        params: dict = None,
+        ttl: float = _METADATA_TTL,
+        disk_ttl: float = None
+    ) -> Optional[Any]:
+        """GET request whose successful result is reused for ``ttl`` seconds.
+
+        With ``disk_ttl`` the result is also kept on disk so later CLI runs
+        can skip the request entirely.
+        """
+        cache_key = self._cache_key(endpoint, params)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        if disk_ttl:
+            result = self._read_disk_cache(endpoint, disk_ttl)
+            if result is not None:
+                self._cache[cache_key] = (time.monotonic(), result)
+                return result
+
+        result = self._request("GET", endpoint, params)
+        if result is not None:
+            self._cache[cache_key] = (time.monotonic(), result)
+            if disk_ttl:
+                self._write_disk_cache(endpoint, result, disk_ttl)
+        return result
+
+    def _disk_cache_path(self, endpoint: str) -> Path:
+        return _CACHE_DIR / self._me_cache_key() / (endpoint.replace("/", "_") + ".json")
+
+    def _read_disk_cache(self, endpoint: str, ttl: float) -> Optional[Any]:
+        """Return disk-cached data for an endpoint if still fresh."""
+        try:
+            entry = _loads(self._disk_cache_path(endpoint).read_bytes())
+        except (OSError, ValueError):
             return None
+        if time.time() - entry.get("fetched_at", 0) < min(ttl, entry.get("ttl", ttl)):
+            return entry.get("data")
+        return None
+
+    def _write_disk_cache(self, endpoint: str, data: Any, ttl: float):
+        path = self._disk_cache_path(endpoint)
+        try:
+            _write_private(path, _dumps({"fetched_at": time.time(), "ttl": ttl, "data": data}))
+        except OSError:
+            pass
+
+    def clear_cache(self):
+        """Forget cached user and board metadata, in memory and on disk."""
+        self._cache.clear()
+        self._lists = {}
+        shutil.rmtree(_CACHE_DIR / self._me_cache_key(), ignore_errors=True)
+        self._forget_cached_me()
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict = None) -> tuple:
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def _bootstrap(self, include_me: bool = True):
+        """Fetch user, lists, labels and members with a single /batch call.
+
+        Results are stored under the same keys ``_cached_request`` uses, so
+        the regular getters are served from the cache afterwards.
+        """
+        board = f"boards/{self.board_id}"
+        targets = [
+            (f"{board}/lists", {"fields": "name"}, _BOARD_DISK_TTL),
+            (f"{board}/labels", {"fields": "name,color"}, _BOARD_DISK_TTL),
+            (f"{board}/members", {"fields": "fullName,username"}, _BOARD_DISK_TTL),
+        ]
+        if include_me:
+            targets.append(("members/me", {"fields": "fullName,username"}, None))
+
+        # Anything still fresh on disk doesn't need to be fetched at all
+        now = time.monotonic()
+        pending = []
+        for endpoint, params, disk_ttl in targets:
+            data = self._read_disk_cache(endpoint, disk_ttl) if disk_ttl else None
+            if data is not None:
+                self._cache[self._cache_key(endpoint, params)] = (now, data)
+            else:
+                pending.append((endpoint, params, disk_ttl))
+        if not pending:
+            return
+
+        # Batch routes are comma separated, so sub-requests use default fields
+        results = self.batch([endpoint for endpoint, _, _ in pending])
+
+        for (endpoint, params, disk_ttl), body in zip(pending, results):
+            if body is not None:
+                # Trim to what the cache key claims before it is stored or persisted
+                body = self._project_fields(body, params["fields"])
+                self._cache[self._cache_key(endpoint, params)] = (now, body)
+                if disk_ttl:
+                    self._write_disk_cache(endpoint, body, disk_ttl)
+
+    @staticmethod
+    def _project_fields(body: Any, fields: str) -> Any:
+        """Reduce a default-field response to ``id`` plus ``fields``."""
+        keys = ("id", *fields.split(","))
+        if isinstance(body, dict):
+            return {k: body.get(k) for k in keys}
+        if isinstance(body, list):
+            return [{k: item.get(k) for k in keys} for item in body if isinstance(item, dict)]
+        return body
+
+    def batch(self, routes: List[str]) -> List[Optional[Any]]:
+        """Run several GET routes through Trello's /batch endpoint.
+
+        Routes are relative to the API root (``"cards/abc"``) and must not
+        contain commas. Returns one result per route, None for failures.
+        """
+        results: List[Optional[Any]] = []
+        # Trello accepts at most 10 routes per batch call
+        for start in range(0, len(routes), 10):
+            chunk = routes[start:start + 10]
+            urls = ",".join("/" + route.lstrip("/") for route in chunk)
+            responses = self._request("GET", "batch", {"urls": urls})
+            if not isinstance(responses, list) or len(responses) != len(chunk):
+                results.extend([None] * len(chunk))
+                continue
+            results.extend(
+                response.get("200") if isinstance(response, dict) else None
+                for response in responses
+            )
+        return results
+
+    def _invalidate_cache(self, endpoint: str):
+        """Drop cached responses for an endpoint."""
+        for cache_key in [k for k in self._cache if k[0] == endpoint]:
+            del self._cache[cache_key]
+        try:
+            self._disk_cache_path(endpoint).unlink()
+        except OSError:
+            pass
+
+    def _me_cache_key(self) -> str:
+        """Key the on-disk user cache by credentials without storing them."""
+        return hashlib.blake2b((self.api_key + self.token).encode(), digest_size=8).hexdigest()
+
+    def _read_me_cache(self) -> dict:
+        try:
+            return _loads(_ME_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _read_cached_me(self) -> Optional[dict]:
+        """Return the cached user for these credentials if still fresh."""
+        entry = self._read_me_cache().get(self._me_cache_key())
+        if entry and time.time() - entry.get("ts", 0) < _ME_CACHE_TTL:
+            return entry.get("me")
+        return None
+
+    def _write_cached_me(self, me: dict):
+        cache = self._read_me_cache()
+        cache[self._me_cache_key()] = {"me": me, "ts": time.time()}
+        try:
+            _write_private(_ME_CACHE_PATH, _dumps(cache))
+        except OSError:
+            pass
+
+    def _forget_cached_me(self):
+        """Drop the cached user after the credentials were rejected."""
+        cache = self._read_me_cache()
+        if cache.pop(self._me_cache_key(), None) is not None:
+            try:
+                _write_private(_ME_CACHE_PATH, _dumps(cache))
+            except OSError:
+                pass
+
+    def _card_id(self, issue_key: str) -> str:
+        """Strip the project key prefix from an issue key."""
+        if issue_key.startswith(self._key_prefix):
+            return issue_key[len(self._key_prefix):]
+        return issue_key
 
     def _get_me(self) -> Optional[dict]:
         """Get current user info."""
-        return self._request("GET", "members/me")
+        return self._cached_request("members/me", {"fields": "fullName,username"}, ttl=_ME_TTL)
 
     def _load_lists(self):
         """Load board lists for status mapping."""
         if not self.board_id:
             return
 
-        lists = self._request("GET", f"boards/{self.board_id}/lists")
+        lists = self._cached_request(
+            f"boards/{self.board_id}/lists", {"fields": "name"}, disk_ttl=_BOARD_DISK_TTL
+        )
         if lists:
             self._lists = {l["name"]: l["id"] for l in lists}
 
+        # Lookup tables so transitions and card creation don't rescan the lists
+        self._lists_lower = {}
+        for name, lid in self._lists.items():
+            self._lists_lower.setdefault(name.lower(), lid)
+        self._list_names = {lid: name for name, lid in self._lists.items()}
+        self._status_index = {
+            key: next((self._lists[n] for n in names if n in self._lists), None)
+            for key, names in self.status_map.items()
+        }
+        self._todo_list_id = next(
+            (lid for name, lid in self._lists_lower.items()
+             if any(s in name for s in ["to do", "backlog", "todo"])),
+            next(iter(self._lists.values()), None)
+        )
+
+    def _reload_lists(self):
+        """Drop the cached board lists and fetch them again."""
+        self._invalidate_cache(f"boards/{self.board_id}/lists")
+        self._lists = {}
+        self._load_lists()
+
+    def _find_list_id(self, status: str) -> Optional[str]:
+        """Resolve a status or list name to a list ID from the loaded lists."""
+        # Exact name, then mapped status, then case-insensitive name
+        status_lower = status.lower()
+        list_id = (
+            self._lists.get(status)
+            or self._status_index.get(status_lower.replace(" ", "_"))
+            or self._lists_lower.get(status_lower)
+        )
+
+        # Fall back to partial match
+        if not list_id:
+            list_id = next(
+                (lid for name, lid in self._lists_lower.items() if status_lower in name),
+                None
+            )
+        return list_id
+
     def get_my_active_issues(self) -> List[Issue]:
         """Get cards assigned to current user."""
         if not self.enabled or not self._me:
             return []
 
-        # Get cards assigned to me on the board
-        cards = self._request("GET", f"boards/{self.board_id}/cards", {
+        # Let Trello return only my cards instead of scanning the whole board
+        cards = self._request("GET", f"members/{self._me['id']}/cards", {
             "filter": "open",
+            "fields": _CARD_FIELDS,
             "members": "true",
             "member_fields": "fullName",
             "list": "true"
@@ -165,20 +477,36 @@ class TrelloIntegration(TaskManagementBase):
         if not cards:
             return []
 
-        my_id = self._me.get("id")
         return [
             self._parse_card(card)
             for card in cards
-            if my_id in card.get("idMembers", [])
+            if not self.board_id or card.get("idBoard") == self.board_id
         ]
 
+    def count_my_cards(self) -> int:
+        """Count open cards assigned to current user on the board."""
+        if not self.enabled or not self._me:
+            return 0
+
+        # Only the board ID is needed to count, not the full card
+        cards = self._request("GET", f"members/{self._me['id']}/cards", {
+            "filter": "open",
+            "fields": "idBoard"
+        })
+
+        if not cards:
+            return 0
+
+        return sum(1 for card in cards if not self.board_id or card.get("idBoard") == self.board_id)
+
     def get_issue(self, issue_key: str) -> Optional[Issue]:
         """Get a single card by ID."""
         if not self.enabled:
             return None
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
         card = self._request("GET", f"cards/{card_id}", {
+            "fields": _CARD_FIELDS,
             "members": "true",
             "member_fields": "fullName",
             "list": "true"
@@ -217,7 +545,7 @@ class TrelloIntegration(TaskManagementBase):
         # If parent_key provided, add as checklist item instead of new card
         # Trello doesn't have subtasks, but has checklists
         if parent_key:
-            parent_card_id = parent_key.replace(f"{self.project_key}-", "")
+            parent_card_id = self._card_id(parent_key)
             # Get or create a "Subtasks" checklist
             checklists = self.get_checklists(parent_key)
             checklist_id = None
@@ -248,15 +576,7 @@ class TrelloIntegration(TaskManagementBase):
         if not self._lists:
             self._load_lists()
 
-        list_id = None
-        for name, lid in self._lists.items():
-            if any(s.lower() in name.lower() for s in ["to do", "backlog", "todo"]):
-                list_id = lid
-                break
-
-        if not list_id and self._lists:
-            list_id = list(self._lists.values())[0]
-
+        list_id = self._todo_list_id
         if not list_id:
             return None
 
@@ -274,11 +594,18 @@ class TrelloIntegration(TaskManagementBase):
         try:
             card = self._request("POST", "cards", card_data)
 
+            if card is None:
+                # Target list may be gone; refetch the lists and retry once
+                self._reload_lists()
+                if self._todo_list_id and self._todo_list_id != list_id:
+                    card_data["idList"] = self._todo_list_id
+                    card = self._request("POST", "cards", card_data)
+
             if card and card.get("id"):
-                return f"{self.project_key}-{card['id']}"
+                return self._key_prefix + card["id"]
             return None
-        except HTTPError as e:
-            if e.code == 401 or e.code == 403:
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
                 raise PermissionError(f"No permission to create cards on board {self.board_id}")
             raise
 
@@ -287,7 +614,7 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         result = self._request("POST", f"cards/{card_id}/actions/comments", {
             "text": comment
@@ -295,48 +622,53 @@ class TrelloIntegration(TaskManagementBase):
 
         return result is not None
 
+    def bulk_add_comment(self, issue_keys: List[str], comment: str) -> Dict[str, bool]:
+        """Add the same comment to several cards concurrently."""
+        if not self.enabled or not issue_keys:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(issue_keys))) as pool:
+            results = pool.map(lambda key: self.add_comment(key, comment), issue_keys)
+            return dict(zip(issue_keys, results))
+
+    def bulk_assign_issues(self, issue_keys: List[str], user_id: str) -> Dict[str, bool]:
+        """Add a member to several cards concurrently."""
+        if not self.enabled or not issue_keys:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(issue_keys))) as pool:
+            results = pool.map(lambda key: self.assign_issue(key, user_id), issue_keys)
+            return dict(zip(issue_keys, results))
+
     def transition_issue(self, issue_key: str, status: str) -> bool:
         """Move card to a list (status)."""
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         if not self._lists:
             self._load_lists()
 
-        # Find list ID
-        list_id = None
-        status_lower = status.lower().replace(" ", "_")
-
-        # Try exact match
-        if status in self._lists:
-            list_id = self._lists[status]
-
-        # Try mapped status
-        if not list_id and status_lower in self.status_map:
-            for mapped_name in self.status_map[status_lower]:
-                if mapped_name in self._lists:
-                    list_id = self._lists[mapped_name]
-                    break
-
-        # Try partial match
+        list_id = self._find_list_id(status)
         if not list_id:
-            for name, lid in self._lists.items():
-                if status.lower() in name.lower():
-                    list_id = lid
-                    break
-
+            # The list may have been created or renamed since the lists were cached
+            self._reload_lists()
+            list_id = self._find_list_id(status)
         if not list_id:
             return False
 
         result = self._request("PUT", f"cards/{card_id}", {"idList": list_id})
-        return result is not None
+        if result is None:
+            # The list may have been renamed or archived; refetch next time
+            self._invalidate_cache(f"boards/{self.board_id}/lists")
+            self._lists = {}
+            return False
+        return True
 
     def format_branch_name(self, issue_key: str, description: str) -> str:
         """Format branch name."""
-        clean_desc = description.lower()
-        clean_desc = "".join(c if c.isalnum() or c == " " else "" for c in clean_desc)
+        clean_desc = _BRANCH_STRIP_RE.sub("", description.lower())
         clean_desc = clean_desc.strip().replace(" ", "-")[:40]
 
         issue_number = issue_key.split("-")[-1][:8] if "-" in issue_key else issue_key[:8]
@@ -369,10 +701,10 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled or not self._me:
             return []
 
-        boards = self._request("GET", f"members/me/boards", {
+        boards = self._cached_request("members/me/boards", {
             "filter": "open",
             "fields": "name,url,shortUrl"
-        })
+        }, disk_ttl=_BOARDS_DISK_TTL)
 
         if not boards:
             return []
@@ -391,7 +723,9 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled or not self.board_id:
             return []
 
-        lists = self._request("GET", f"boards/{self.board_id}/lists")
+        lists = self._cached_request(
+            f"boards/{self.board_id}/lists", {"fields": "name"}, disk_ttl=_BOARD_DISK_TTL
+        )
 
         if not lists:
             return []
@@ -403,9 +737,9 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled or not self.board_id:
             return []
 
-        members = self._request("GET", f"boards/{self.board_id}/members", {
+        members = self._cached_request(f"boards/{self.board_id}/members", {
             "fields": "fullName,username"
-        })
+        }, disk_ttl=_BOARD_DISK_TTL)
 
         if not members:
             return []
@@ -420,12 +754,31 @@ class TrelloIntegration(TaskManagementBase):
             for m in members
         ]
 
+    def find_member(self, query: str) -> Optional[Dict]:
+        """Find a board member by name or username, exact match first."""
+        return self._find_by_name(self.get_team_members(), query, ("name", "username"))
+
+    @staticmethod
+    def _find_by_name(items: List[Dict], query: str, keys: tuple) -> Optional[Dict]:
+        """Exact (case-insensitive) match on any key, then partial match on ``name``."""
+        if not query:
+            return None
+
+        query_lower = query.lower()
+        # Lowercase every candidate once and reuse it for both passes
+        index = [(item, [(item.get(k) or "").lower() for k in keys]) for item in items]
+        for item, names in index:
+            if query_lower in names:
+                return item
+        name_pos = keys.index("name")
+        return next((item for item, names in index if query_lower in names[name_pos]), None)
+
     def assign_issue(self, issue_key: str, user_id: str) -> bool:
         """Add member to card."""
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         result = self._request("POST", f"cards/{card_id}/idMembers", {
             "value": user_id
@@ -438,15 +791,20 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         # Get card members
-        card = self._request("GET", f"cards/{card_id}")
+        card = self._request("GET", f"cards/{card_id}", {"fields": "idMembers"})
         if not card:
             return False
 
-        for member_id in card.get("idMembers", []):
-            self._request("DELETE", f"cards/{card_id}/idMembers/{member_id}")
+        member_ids = card.get("idMembers", [])
+        if member_ids:
+            with ThreadPoolExecutor(max_workers=min(8, len(member_ids))) as pool:
+                list(pool.map(
+                    lambda member_id: self._request("DELETE", f"cards/{card_id}/idMembers/{member_id}"),
+                    member_ids
+                ))
 
         return True
 
@@ -457,6 +815,7 @@ class TrelloIntegration(TaskManagementBase):
 
         cards = self._request("GET", f"boards/{self.board_id}/cards", {
             "filter": "open",
+            "fields": _CARD_FIELDS,
             "members": "true"
         })
 
@@ -469,14 +828,55 @@ class TrelloIntegration(TaskManagementBase):
             if not card.get("idMembers")
         ]
 
+    def get_board_issues(self, list_name: str = None, label: str = None) -> List[Issue]:
+        """Get open board cards, optionally filtered by list and label name."""
+        return [issue for _, issue in self._get_board_cards(list_name, label)]
+
+    def split_board_issues_by_member(self, member_id: str, list_name: str = None,
+                                     label: str = None) -> Tuple[List[Issue], List[Issue]]:
+        """Split matching board cards into (without member, already with member)."""
+        pending, assigned = [], []
+        for card, issue in self._get_board_cards(list_name, label):
+            (assigned if member_id in (card.get("idMembers") or ()) else pending).append(issue)
+        return pending, assigned
+
+    def _get_board_cards(self, list_name: str = None, label: str = None) -> List[Tuple[dict, Issue]]:
+        """Get open board cards with their parsed issues, filtered by list and label name."""
+        if not self.enabled or not self.board_id:
+            return []
+
+        if not self._lists:
+            self._load_lists()
+
+        cards = self._request("GET", f"boards/{self.board_id}/cards", {
+            "filter": "open",
+            "fields": _CARD_FIELDS,
+            "members": "true",
+            "member_fields": "fullName"
+        })
+
+        if not cards:
+            return []
+
+        pairs = [(card, self._parse_card(card)) for card in cards]
+        if list_name:
+            list_lower = list_name.lower()
+            pairs = [(c, i) for c, i in pairs if i.status.lower() == list_lower]
+        if label:
+            label_lower = label.lower()
+            pairs = [(c, i) for c, i in pairs if any(l.lower() == label_lower for l in i.labels)]
+        return pairs
+
     def search_issues(self, query: str, max_results: int = 50) -> List[Issue]:
         """Search cards by name."""
         if not self.enabled or not self.board_id:
             return []
 
-        # Get all cards and filter
+        # Trello's /search matches word prefixes across several fields and
+        # may return archived cards; filter open cards by name instead
         cards = self._request("GET", f"boards/{self.board_id}/cards", {
             "filter": "open",
+            "fields": _CARD_FIELDS,
             "members": "true",
             "member_fields": "fullName",
             "list": "true"
@@ -497,7 +897,7 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         result = self._request("PUT", f"cards/{card_id}", {"closed": "true"})
         return result is not None
@@ -507,7 +907,9 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled or not self.board_id:
             return []
 
-        labels = self._request("GET", f"boards/{self.board_id}/labels")
+        labels = self._cached_request(
+            f"boards/{self.board_id}/labels", {"fields": "name,color"}, disk_ttl=_BOARD_DISK_TTL
+        )
 
         if not labels:
             return []
@@ -521,12 +923,16 @@ class TrelloIntegration(TaskManagementBase):
             for l in labels
         ]
 
+    def find_label(self, query: str) -> Optional[Dict]:
+        """Find a board label by ID or name, exact match first."""
+        return self._find_by_name(self.get_labels(), query, ("id", "name"))
+
     def add_label(self, issue_key: str, label_id: str) -> bool:
         """Add label to card."""
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         result = self._request("POST", f"cards/{card_id}/idLabels", {
             "value": label_id
@@ -539,13 +945,37 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled:
             return []
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         checklists = self._request("GET", f"cards/{card_id}/checklists")
 
         if not checklists:
             return []
 
+        return self._parse_checklists(checklists)
+
+    def get_card_full(self, issue_key: str) -> Tuple[Optional[Issue], List[Dict]]:
+        """Get a card together with its checklists in a single request."""
+        if not self.enabled:
+            return None, []
+
+        card_id = self._card_id(issue_key)
+        card = self._request("GET", f"cards/{card_id}", {
+            "fields": _CARD_FIELDS,
+            "members": "true",
+            "member_fields": "fullName",
+            "list": "true",
+            "checklists": "all",
+            "checklist_fields": "name"
+        })
+
+        if not card:
+            return None, []
+        return self._parse_card(card), self._parse_checklists(card.get("checklists") or [])
+
+    @staticmethod
+    def _parse_checklists(checklists: List[dict]) -> List[Dict]:
+        """Parse Trello checklists with their items."""
         result = []
         for cl in checklists:
             items = [
@@ -568,7 +998,7 @@ class TrelloIntegration(TaskManagementBase):
         if not self.enabled:
             return False
 
-        card_id = issue_key.replace(f"{self.project_key}-", "")
+        card_id = self._card_id(issue_key)
 
         checklist = self._request("POST", "checklists", {
             "idCard": card_id,
@@ -579,38 +1009,47 @@ class TrelloIntegration(TaskManagementBase):
             return False
 
         if items:
-            for item in items:
-                self._request("POST", f"checklists/{checklist['id']}/checkItems", {
-                    "name": item
-                })
+            # Items are independent; post them in parallel over the pooled session.
+            # Explicit positions keep the given order regardless of arrival order.
+            endpoint = f"checklists/{checklist['id']}/checkItems"
+            with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+                list(pool.map(
+                    lambda pair: self._request("POST", endpoint, {"name": pair[1], "pos": pair[0]}),
+                    enumerate(items, 1)
+                ))
 
         return True
 
     def _parse_card(self, card: dict) -> Issue:
         """Parse Trello card to Issue."""
+        # Hot path for every list-returning call; keep lookups local
+        g = card.get
+
         # Get list name (status)
-        status = "Unknown"
-        if card.get("list"):
-            status = card["list"].get("name", "Unknown")
+        lst = g("list")
+        if lst:
+            status = lst.get("name", "Unknown")
+        else:
+            status = self._list_names.get(g("idList"), "Unknown")
 
         # Get assignee
-        assignee = None
-        members = card.get("members", [])
-        if members:
-            assignee = members[0].get("fullName")
+        members = g("members")
+        assignee = members[0].get("fullName") if members else None
 
-        card_id = card.get("id", "")
+        url = g("shortUrl")
+        if url is None:
+            url = g("url", "")
 
         return Issue(
-            key=f"{self.project_key}-{card_id}",
-            summary=card.get("name", "Untitled"),
-            description=card.get("desc", "") or "",
+            key=self._key_prefix + g("id", ""),
+            summary=g("name", "Untitled"),
+            description=g("desc") or "",
             status=status,
             issue_type="card",
             assignee=assignee,
-            url=card.get("shortUrl", card.get("url", "")),
+            url=url,
             story_points=None,
-            labels=[l.get("name") for l in card.get("labels", []) if l.get("name")]
+            labels=[name for name in (l.get("name") for l in g("labels") or ()) if name]
         )
 
     def on_commit(self, group: dict, context: dict):
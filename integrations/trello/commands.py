@@ -9,11 +9,11 @@ Commands:
 - rg trello create    : Create a new card
 - rg trello move      : Move card to list
 - rg trello assign    : Assign card to member
+- rg trello bulk-assign: Assign matching cards to member
+- rg trello cache     : Manage cached board data
 """
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing import Optional
 
 try:
@@ -23,12 +23,24 @@ except ImportError:
     ConfigManager = None
     get_task_management = None
 
-console = Console()
+_console = None
 trello_app = typer.Typer(help="Trello board management")
+cache_app = typer.Typer(help="Cached board data")
+trello_app.add_typer(cache_app, name="cache")
+
+
+def _get_console():
+    """Create the Rich console on first use (keeps rich off the import path)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 def _get_trello():
     """Get configured Trello integration."""
+    console = _get_console()
     if not ConfigManager:
         console.print("[red]RedGit not properly installed.[/red]")
         raise typer.Exit(1)
@@ -47,6 +59,9 @@ def _get_trello():
 @trello_app.command("boards")
 def list_boards():
     """List your Trello boards."""
+    from rich.table import Table
+
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Trello Boards[/bold cyan]\n")
@@ -76,6 +91,7 @@ def list_boards():
 @trello_app.command("lists")
 def list_lists():
     """List board columns (lists)."""
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Board Lists[/bold cyan]\n")
@@ -94,6 +110,9 @@ def list_issues(
     all_issues: bool = typer.Option(False, "--all", "-a", help="Show all board cards")
 ):
     """List my cards."""
+    from rich.table import Table
+
+    console = _get_console()
     trello = _get_trello()
 
     console.print(f"\n[bold cyan]Trello Cards[/bold cyan]\n")
@@ -115,14 +134,14 @@ def list_issues(
     table.add_column("List")
     table.add_column("Assignee", style="dim")
 
-    for issue in issues:
-        short_id = issue.key.split("-")[-1][:8] + "..."
-        table.add_row(
-            short_id,
-            issue.summary[:35] + ("..." if len(issue.summary) > 35 else ""),
-            issue.status,
-            issue.assignee or "-"
-        )
+    rows = [
+        (i.key.rsplit("-", 1)[-1][:8] + "...",
+         i.summary[:35] + "..." if len(i.summary) > 35 else i.summary,
+         i.status, i.assignee or "-")
+        for i in issues
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"\n[dim]Total: {len(issues)} cards[/dim]")
@@ -131,6 +150,9 @@ def list_issues(
 @trello_app.command("team")
 def list_team():
     """List board members."""
+    from rich.table import Table
+
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Board Members[/bold cyan]\n")
@@ -154,6 +176,9 @@ def list_team():
 @trello_app.command("unassigned")
 def list_unassigned():
     """List unassigned cards."""
+    from rich.table import Table
+
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Unassigned Cards[/bold cyan]\n")
@@ -185,6 +210,7 @@ def create_card(
     list_name: Optional[str] = typer.Option(None, "--list", "-l", help="Target list name")
 ):
     """Create a new card."""
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Creating card...[/bold cyan]\n")
@@ -212,6 +238,7 @@ def move_card(
     list_name: str = typer.Argument(..., help="Target list name")
 ):
     """Move card to a list."""
+    console = _get_console()
     trello = _get_trello()
 
     if trello.transition_issue(issue_key, list_name):
@@ -225,17 +252,21 @@ def move_card(
 @trello_app.command("assign")
 def assign_card(
     issue_key: str = typer.Argument(..., help="Card ID"),
-    user: Optional[str] = typer.Argument(None, help="User name or number")
+    user: Optional[str] = typer.Argument(None, help="User name or number"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show the card before assigning")
 ):
     """Assign card to member."""
+    console = _get_console()
     trello = _get_trello()
 
-    issue = trello.get_issue(issue_key)
-    if not issue:
-        console.print(f"[red]Card not found.[/red]")
-        raise typer.Exit(1)
+    # Only fetch the card for display; the assign call itself fails on a bad ID
+    if verbose or not user:
+        issue = trello.get_issue(issue_key)
+        if not issue:
+            console.print(f"[red]Card not found.[/red]")
+            raise typer.Exit(1)
 
-    console.print(f"\n[bold]{issue_key}[/bold]: {issue.summary}")
+        console.print(f"\n[bold]{issue_key}[/bold]: {issue.summary}")
 
     members = trello.get_team_members()
     if not members:
@@ -256,20 +287,61 @@ def assign_card(
             user_id = members[idx]["id"]
             display_name = members[idx]["name"]
     except ValueError:
-        for m in members:
-            if user.lower() in m["name"].lower():
-                user_id = m["id"]
-                display_name = m["name"]
-                break
+        member = trello.find_member(user)
+        if member:
+            user_id = member["id"]
+            display_name = member["name"]
 
     if not user_id:
         console.print(f"[red]User not found.[/red]")
         raise typer.Exit(1)
 
     if trello.assign_issue(issue_key, user_id):
-        console.print(f"\n[green]Assigned to {display_name}[/green]")
+        console.print(f"\n[green]Assigned {issue_key} to {display_name}[/green]")
     else:
-        console.print("[red]Failed to assign.[/red]")
+        console.print("[red]Failed to assign (check the card ID).[/red]")
+        raise typer.Exit(1)
+
+
+@trello_app.command("bulk-assign")
+def bulk_assign(
+    user: str = typer.Argument(..., help="User name or username"),
+    label: Optional[str] = typer.Option(None, "--label", "-L", help="Only cards with this label"),
+    list_name: Optional[str] = typer.Option(None, "--list", "-l", help="Only cards in this list"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation")
+):
+    """Assign every matching card to a member."""
+    console = _get_console()
+    trello = _get_trello()
+
+    if not label and not list_name:
+        console.print("[red]Pass --label and/or --list to select cards.[/red]")
+        raise typer.Exit(1)
+
+    member = trello.find_member(user)
+    if not member:
+        console.print(f"[red]User not found.[/red]")
+        raise typer.Exit(1)
+
+    issues, already = trello.split_board_issues_by_member(member["id"], list_name=list_name, label=label)
+    if not issues and not already:
+        console.print("[yellow]No matching cards.[/yellow]")
+        return
+
+    if already:
+        console.print(f"[dim]Already assigned to {member['name']}: {len(already)}[/dim]")
+    if not issues:
+        return
+
+    if not yes and not typer.confirm(f"Assign {len(issues)} cards to {member['name']}?"):
+        raise typer.Exit(0)
+
+    results = trello.bulk_assign_issues([i.key for i in issues], member["id"])
+    assigned = sum(results.values())
+
+    console.print(f"\n[green]Assigned {assigned} cards to {member['name']}[/green]")
+    if assigned < len(issues):
+        console.print(f"[red]Failed: {len(issues) - assigned}[/red]")
         raise typer.Exit(1)
 
 
@@ -278,6 +350,7 @@ def unassign_card(
     issue_key: str = typer.Argument(..., help="Card ID")
 ):
     """Remove all members from card."""
+    console = _get_console()
     trello = _get_trello()
 
     if trello.unassign_issue(issue_key):
@@ -292,6 +365,7 @@ def archive_card(
     issue_key: str = typer.Argument(..., help="Card ID")
 ):
     """Archive a card."""
+    console = _get_console()
     trello = _get_trello()
 
     if trello.archive_card(issue_key):
@@ -304,6 +378,7 @@ def archive_card(
 @trello_app.command("labels")
 def list_labels():
     """List board labels."""
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Board Labels[/bold cyan]\n")
@@ -324,16 +399,12 @@ def add_label(
     label: str = typer.Argument(..., help="Label name or ID")
 ):
     """Add label to card."""
+    console = _get_console()
     trello = _get_trello()
 
     # Find label ID
-    labels = trello.get_labels()
-    label_id = None
-
-    for l in labels:
-        if l["id"] == label or (l["name"] and label.lower() in l["name"].lower()):
-            label_id = l["id"]
-            break
+    match = trello.find_label(label)
+    label_id = match["id"] if match else None
 
     if not label_id:
         console.print(f"[red]Label not found.[/red]")
@@ -352,16 +423,16 @@ def show_checklists(
     issue_key: str = typer.Argument(..., help="Card ID")
 ):
     """Show card checklists."""
+    console = _get_console()
     trello = _get_trello()
 
-    issue = trello.get_issue(issue_key)
+    issue, checklists = trello.get_card_full(issue_key)
     if not issue:
         console.print(f"[red]Card not found.[/red]")
         raise typer.Exit(1)
 
     console.print(f"\n[bold cyan]Checklists: {issue.summary[:40]}[/bold cyan]\n")
 
-    checklists = trello.get_checklists(issue_key)
     if not checklists:
         console.print("[yellow]No checklists.[/yellow]")
         return
@@ -381,6 +452,7 @@ def add_checklist(
     items: Optional[str] = typer.Option(None, "--items", "-i", help="Comma-separated items")
 ):
     """Create a checklist on card."""
+    console = _get_console()
     trello = _get_trello()
 
     item_list = [i.strip() for i in items.split(",")] if items else None
@@ -399,6 +471,9 @@ def search_cards(
     query: str = typer.Argument(..., help="Search query")
 ):
     """Search cards by name."""
+    from rich.table import Table
+
+    console = _get_console()
     trello = _get_trello()
 
     console.print(f"\n[bold cyan]Search: {query}[/bold cyan]\n")
@@ -426,6 +501,7 @@ def search_cards(
 @trello_app.command("status")
 def status_cmd():
     """Show Trello integration status."""
+    console = _get_console()
     trello = _get_trello()
 
     console.print("\n[bold cyan]Trello Status[/bold cyan]\n")
@@ -435,5 +511,14 @@ def status_cmd():
     if trello._me:
         console.print(f"   User: {trello._me.get('fullName', trello._me.get('username', 'Unknown'))}")
 
-    my_cards = trello.get_my_active_issues()
-    console.print(f"   My Cards: {len(my_cards)}")
\ No newline at end of file
+    console.print(f"   My Cards: {trello.count_my_cards()}")
+
+
+@cache_app.command("clear")
+def clear_cache():
+    """Forget cached boards, lists, labels and members."""
+    console = _get_console()
+    trello = _get_trello()
+
+    trello.clear_cache()
+    console.print("[green]Trello cache cleared[/green]")
@@ -5,10 +5,9 @@ Send notifications via WhatsApp Business Cloud API.
 """
 
 import os
-import json
-from typing import Optional, Dict
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+import requests
+from typing import Any, Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from redgit.integrations.base import NotificationBase, IntegrationType
@@ -24,6 +23,39 @@ except ImportError:
         def send_message(self, message, channel=None): pass
 
 
+# JSON encode/decode, via orjson when it is installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+_EVENT_EMOJIS = {
+    "commit": "\U0001F528",      # Hammer
+    "branch": "\U0001F331",      # Seedling
+    "pr": "\U0001F500",          # Twisted arrows
+    "task": "\U0001F4CB",        # Clipboard
+    "deploy": "\U0001F680",      # Rocket
+    "alert": "\U000026A0",       # Warning
+    "message": "\U0001F4AC",     # Speech balloon
+}
+
+_LEVEL_ICONS = {
+    "info": "\U0001F535",      # Blue circle
+    "success": "\U00002705",   # Check mark
+    "warning": "\U000026A0",   # Warning
+    "error": "\U0000274C",     # X mark
+}
+
+
 class WhatsAppIntegration(NotificationBase):
     """WhatsApp notification integration via Business Cloud API"""
 
@@ -35,6 +67,8 @@ class WhatsAppIntegration(NotificationBase):
         self.access_token = ""
         self.phone_number_id = ""
         self.recipient_number = ""
+        self.session = None
+        self._messages_url = ""
 
     def setup(self, config: dict):
         """Setup WhatsApp Business API."""
@@ -46,6 +80,13 @@ class WhatsAppIntegration(NotificationBase):
             self.enabled = False
             return
 
+        # Keep-alive session shared by every Graph API call
+        self._messages_url = f"https://graph.facebook.com/v18.0/{self.phone_number_id}/messages"
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.access_token}"
+        })
         self.enabled = True
 
     def send_message(self, message: str, channel: str = None) -> bool:
@@ -56,6 +97,15 @@ class WhatsAppIntegration(NotificationBase):
         recipient = channel or self.recipient_number
         return self._send_text_message(recipient, message)
 
+    def send_many(self, message: str, channels: List[str]) -> Dict[str, bool]:
+        """Send the same message to several recipients concurrently."""
+        if not self.enabled or not channels:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(channels))) as pool:
+            results = pool.map(lambda channel: self.send_message(message, channel), channels)
+            return dict(zip(channels, results))
+
     def notify(
         self,
         event_type: str,
@@ -70,42 +120,20 @@ class WhatsAppIntegration(NotificationBase):
         if not self.enabled:
             return False
 
-        emojis = {
-            "commit": "\U0001F528",      # Hammer
-            "branch": "\U0001F331",      # Seedling
-            "pr": "\U0001F500",          # Twisted arrows
-            "task": "\U0001F4CB",        # Clipboard
-            "deploy": "\U0001F680",      # Rocket
-            "alert": "\U000026A0",       # Warning
-            "message": "\U0001F4AC",     # Speech balloon
-        }
-        emoji = emojis.get(event_type, "\U0001F514")  # Bell
-
-        level_icons = {
-            "info": "\U0001F535",      # Blue circle
-            "success": "\U00002705",   # Check mark
-            "warning": "\U000026A0",   # Warning
-            "error": "\U0000274C",     # X mark
-        }
-        level_icon = level_icons.get(level, "")
+        emoji = _EVENT_EMOJIS.get(event_type, "\U0001F514")  # Bell
+        level_icon = _LEVEL_ICONS.get(level, "")
 
         # Build message (WhatsApp has limited formatting)
-        lines = [f"{emoji} *{title}*"]
-
+        parts = [f"{emoji} *{title}*"]
         if message:
-            lines.append(f"\n{message}")
-
+            parts.append(f"\n{message}")
         if fields:
-            lines.append("")
-            for k, v in fields.items():
-                lines.append(f"*{k}:* {v}")
-
+            parts.append("\n" + "\n".join(f"*{k}:* {v}" for k, v in fields.items()))
         if url:
-            lines.append(f"\n{url}")
+            parts.append(f"\n{url}")
+        parts.append(f"\n{level_icon} _via RedGit_")
 
-        lines.append(f"\n{level_icon} _via RedGit_")
-
-        text = "\n".join(lines)
+        text = "\n".join(parts)
         recipient = channel or self.recipient_number
 
         return self._send_text_message(recipient, text)
@@ -113,8 +141,6 @@ class WhatsAppIntegration(NotificationBase):
     def _send_text_message(self, recipient: str, text: str) -> bool:
         """Send text message via WhatsApp Business API."""
         try:
-            url = f"https://graph.facebook.com/v18.0/{self.phone_number_id}/messages"
-
             payload = {
                 "messaging_product": "whatsapp",
                 "recipient_type": "individual",
@@ -126,21 +152,9 @@ class WhatsAppIntegration(NotificationBase):
                 }
             }
 
-            data = json.dumps(payload).encode("utf-8")
-            req = Request(
-                url,
-                data=data,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.access_token}"
-                },
-                method="POST"
-            )
-
-            with urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return "messages" in result
-        except (HTTPError, URLError):
+            response = self.session.post(self._messages_url, data=_dumps(payload), timeout=10)
+            return "messages" in _loads(response.content)
+        except (requests.RequestException, ValueError):
             return False
 
     @staticmethod
@@ -153,10 +167,7 @@ class WhatsAppIntegration(NotificationBase):
         if all([access_token, phone_number_id, recipient_number]):
             typer.echo("\n   Testing WhatsApp Business API...")
             temp = WhatsAppIntegration()
-            temp.access_token = access_token
-            temp.phone_number_id = phone_number_id
-            temp.recipient_number = recipient_number
-            temp.enabled = True
+            temp.setup(config_values)
             if temp.send_message("\U00002705 RedGit connected successfully!"):
                 typer.secho("   Test message sent!", fg=typer.colors.GREEN)
             else:
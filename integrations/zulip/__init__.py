@@ -5,11 +5,10 @@ Send notifications to Zulip streams via Bot API.
 """
 
 import os
-import json
 import base64
-from typing import Optional, Dict
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+import requests
+from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from redgit.integrations.base import NotificationBase, IntegrationType
@@ -25,6 +24,35 @@ except ImportError:
         def send_message(self, message, channel=None): pass
 
 
+# JSON decoding, via orjson when it is installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+
+_EVENT_EMOJIS = {
+    "commit": ":hammer:",
+    "branch": ":seedling:",
+    "pr": ":twisted_rightwards_arrows:",
+    "task": ":clipboard:",
+    "deploy": ":rocket:",
+    "alert": ":warning:",
+    "message": ":speech_balloon:",
+}
+
+_LEVEL_EMOJIS = {
+    "info": ":information_source:",
+    "success": ":check:",
+    "warning": ":warning:",
+    "error": ":cross_mark:",
+}
+
+
 class ZulipIntegration(NotificationBase):
     """Zulip notification integration via Bot API"""
 
@@ -38,6 +66,8 @@ class ZulipIntegration(NotificationBase):
         self.api_key = ""
         self.stream = ""
         self.topic = "RedGit"
+        self.session = None
+        self._messages_url = ""
 
     def setup(self, config: dict):
         """Setup Zulip bot."""
@@ -54,6 +84,12 @@ class ZulipIntegration(NotificationBase):
             self.enabled = False
             return
 
+        # Keep-alive session shared by every API call; the Basic auth
+        # header is encoded once here rather than on every send
+        auth = base64.b64encode(f"{self.bot_email}:{self.api_key}".encode()).decode()
+        self._messages_url = f"{self.server_url}/api/v1/messages"
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Basic {auth}"})
         self.enabled = True
 
     def send_message(self, message: str, channel: str = None) -> bool:
@@ -67,6 +103,15 @@ class ZulipIntegration(NotificationBase):
             content=message
         )
 
+    def send_many(self, message: str, channels: List[str]) -> Dict[str, bool]:
+        """Send the same message to several streams concurrently."""
+        if not self.enabled or not channels:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(channels))) as pool:
+            results = pool.map(lambda channel: self.send_message(message, channel), channels)
+            return dict(zip(channels, results))
+
     def notify(
         self,
         event_type: str,
@@ -81,42 +126,20 @@ class ZulipIntegration(NotificationBase):
         if not self.enabled:
             return False
 
-        emojis = {
-            "commit": ":hammer:",
-            "branch": ":seedling:",
-            "pr": ":twisted_rightwards_arrows:",
-            "task": ":clipboard:",
-            "deploy": ":rocket:",
-            "alert": ":warning:",
-            "message": ":speech_balloon:",
-        }
-        emoji = emojis.get(event_type, ":bell:")
-
-        level_emojis = {
-            "info": ":information_source:",
-            "success": ":check:",
-            "warning": ":warning:",
-            "error": ":cross_mark:",
-        }
-        level_emoji = level_emojis.get(level, "")
+        emoji = _EVENT_EMOJIS.get(event_type, ":bell:")
+        level_emoji = _LEVEL_EMOJIS.get(level, "")
 
         # Build message content (Zulip uses Markdown)
-        lines = [f"## {emoji} {title}"]
-
+        parts = [f"## {emoji} {title}"]
         if message:
-            lines.append(f"\n{message}")
-
+            parts.append(f"\n{message}")
         if fields:
-            lines.append("")
-            for k, v in fields.items():
-                lines.append(f"**{k}:** {v}")
-
+            parts.append("\n" + "\n".join(f"**{k}:** {v}" for k, v in fields.items()))
         if url:
-            lines.append(f"\n[View Details]({url})")
-
-        lines.append(f"\n{level_emoji} *via RedGit*")
+            parts.append(f"\n[View Details]({url})")
+        parts.append(f"\n{level_emoji} *via RedGit*")
 
-        content = "\n".join(lines)
+        content = "\n".join(parts)
         topic = f"{event_type}: {title[:30]}" if title else self.topic
 
         return self._send_stream_message(
@@ -128,37 +151,17 @@ class ZulipIntegration(NotificationBase):
     def _send_stream_message(self, stream: str, topic: str, content: str) -> bool:
         """Send message to Zulip stream."""
         try:
-            url = f"{self.server_url}/api/v1/messages"
-
             # Zulip uses form data
-            from urllib.parse import urlencode
             payload = {
                 "type": "stream",
                 "to": stream,
                 "topic": topic,
                 "content": content
             }
-            data = urlencode(payload).encode("utf-8")
-
-            # Basic auth with bot email and API key
-            auth = base64.b64encode(
-                f"{self.bot_email}:{self.api_key}".encode()
-            ).decode()
-
-            req = Request(
-                url,
-                data=data,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Authorization": f"Basic {auth}"
-                },
-                method="POST"
-            )
-
-            with urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result.get("result") == "success"
-        except (HTTPError, URLError):
+
+            response = self.session.post(self._messages_url, data=payload, timeout=10)
+            return _loads(response.content).get("result") == "success"
+        except (requests.RequestException, ValueError):
             return False
 
     @staticmethod
@@ -172,12 +175,7 @@ class ZulipIntegration(NotificationBase):
         if all([server_url, bot_email, api_key, stream]):
             typer.echo("\n   Testing Zulip bot...")
             temp = ZulipIntegration()
-            temp.server_url = server_url.rstrip("/")
-            temp.bot_email = bot_email
-            temp.api_key = api_key
-            temp.stream = stream
-            temp.topic = "RedGit"
-            temp.enabled = True
+            temp.setup(config_values)
             if temp.send_message(":check: RedGit connected successfully!"):
                 typer.secho("   Test message sent!", fg=typer.colors.GREEN)
             else:
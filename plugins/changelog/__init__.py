@@ -15,13 +15,20 @@ Features:
     - Updates main CHANGELOG.md
 """
 
+import functools
+import io
+import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable, Iterator, NamedTuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from collections import defaultdict
+from itertools import islice
 
 try:
     from redgit.plugins.base import Plugin
@@ -40,7 +47,22 @@ except ImportError:
     RETGIT_DIR = Path(".redgit")
 
 
-@dataclass
+# One record per commit: hash, author, email, committer date, raw message.
+# Records start with RS (\x1e); the message ends with GS (\x1d) and is
+# followed by the commit's --numstat lines.
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%cI%x1f%B%x1d"
+_LOG_CHUNK_SIZE = 1 << 16
+
+# Conventional commit subject: type(scope): message
+_CONVENTIONAL_RE = re.compile(r"^(\w+)(?:\(([^)]+)\))?\s*:\s*(.+)$")
+_TRAILING_PUNCT_RE = re.compile(r'[.!?]+$')
+_ISSUE_REF_RE = re.compile(r'\s*[\(\[](#?\d+[\)\]])')
+
+# dataclass(slots=...) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class CommitInfo:
     hash: str
     type: str
@@ -53,17 +75,18 @@ class CommitInfo:
     additions: int = 0
     deletions: int = 0
     files_changed: int = 0
+    _normalized: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def parse(cls, hash: str, full_message: str, date: datetime,
               author: str = "", email: str = "") -> "CommitInfo":
         """Parse a commit message into structured info."""
-        lines = full_message.strip().split("\n")
-        first_line = lines[0].strip()
-        body = "\n".join(lines[1:]).strip() if len(lines) > 1 else None
+        first_line, sep, rest = full_message.strip().partition("\n")
+        first_line = first_line.strip()
+        body = rest.strip() if sep else None
 
         # Parse conventional commit format: type(scope): message
-        match = re.match(r"^(\w+)(?:\(([^)]+)\))?\s*:\s*(.+)$", first_line)
+        match = _CONVENTIONAL_RE.match(first_line)
         if match:
             return cls(
                 hash=hash[:7],
@@ -88,18 +111,23 @@ class CommitInfo:
             email=email
         )
 
+    @property
     def normalized_message(self) -> str:
-        """Get normalized message for deduplication."""
+        """Normalized message for deduplication (computed once)."""
+        if self._normalized is not None:
+            return self._normalized
+
         # Remove common variations
         msg = self.message.lower().strip()
         # Remove trailing punctuation
-        msg = re.sub(r'[.!?]+$', '', msg)
+        msg = _TRAILING_PUNCT_RE.sub('', msg)
         # Remove issue references like (#123), [#123], etc.
-        msg = re.sub(r'\s*[\(\[](#?\d+[\)\]])', '', msg)
+        msg = _ISSUE_REF_RE.sub('', msg)
+        self._normalized = msg
         return msg
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AuthorStats:
     name: str
     email: str
@@ -109,6 +137,79 @@ class AuthorStats:
     percentage: float = 0.0
 
 
+@functools.lru_cache(maxsize=8)
+def _git_dirs(cwd: str) -> Optional[Tuple[Path, Path]]:
+    """Resolve the git dir and common dir for ``cwd`` (once per directory)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-dir", "--git-common-dir"],
+            capture_output=True, text=True, check=True, cwd=cwd
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    lines = result.stdout.splitlines()
+    if len(lines) != 2:
+        return None
+    # Paths may be relative to cwd
+    return Path(cwd, lines[0]), Path(cwd, lines[1])
+
+
+def _git_state_key(cwd: str) -> Optional[Tuple]:
+    """Fingerprint HEAD and tag refs by their file mtimes.
+
+    ``logs/HEAD`` is appended on every commit, checkout or reset, and new
+    top-level tags touch ``refs/tags`` or ``packed-refs``. Returns None when
+    no reliable key exists: a tag added to an existing subdirectory of
+    ``refs/tags`` leaves its mtime alone, and reftable repos keep none of
+    these files up to date.
+    """
+    dirs = _git_dirs(cwd)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    tags_dir = common_dir / "refs" / "tags"
+
+    if (common_dir / "reftable").is_dir():
+        return None
+    try:
+        with os.scandir(tags_dir) as entries:
+            if any(entry.is_dir(follow_symlinks=False) for entry in entries):
+                return None
+    except OSError:
+        pass
+
+    key = []
+    for path in (git_dir / "HEAD", git_dir / "logs" / "HEAD", tags_dir, common_dir / "packed-refs"):
+        try:
+            key.append(path.stat().st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=8)
+def _git_describe(cwd: str, state: Optional[Tuple]) -> Optional[str]:
+    """Run ``git describe`` for the latest tag; cached per (cwd, state)."""
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--tags", "--abbrev=0"],
+            capture_output=True, text=True, check=True, cwd=cwd
+        )
+        return result.stdout.strip()
+    except subprocess.CalledProcessError:
+        # No tags exist
+        return None
+
+
+class ChangelogAnalysis(NamedTuple):
+    """Result of ChangelogPlugin.analyze."""
+    total: int
+    unique: List[CommitInfo]
+    by_type: Dict[str, List[CommitInfo]]
+    by_date: Dict[str, List[CommitInfo]]
+    author_stats: List[AuthorStats]
+
+
 class ChangelogPlugin(Plugin):
     """Changelog generation plugin with LLM summary support."""
 
@@ -128,18 +229,31 @@ class ChangelogPlugin(Plugin):
         "other": ("Other Changes", "📝"),
     }
 
+    # Commits listed in the LLM prompt before switching to per-type samples
+    DEFAULT_MAX_LLM_COMMITS = 500
+
     TYPE_ORDER = ["feat", "fix", "perf", "refactor", "docs", "test", "chore", "style", "ci", "build", "other"]
 
+    # Markdown section headings, built once from TYPE_DISPLAY
+    _TYPE_HEADERS = {t: f"### {emoji} {name}" for t, (name, emoji) in TYPE_DISPLAY.items()}
+
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
+        self._full_config = None
         self._config = None
 
+    @property
+    def full_config(self) -> dict:
+        """Full RedGit config, loaded once per plugin instance."""
+        if self._full_config is None:
+            self._full_config = self.config_manager.load()
+        return self._full_config
+
     @property
     def config(self) -> dict:
         if self._config is None:
-            full_config = self.config_manager.load()
-            self._config = full_config.get("plugins", {}).get("changelog", {})
+            self._config = self.full_config.get("plugins", {}).get("changelog", {})
         return self._config
 
     def match(self) -> bool:
@@ -147,18 +261,112 @@ class ChangelogPlugin(Plugin):
 
     def get_latest_tag(self) -> Optional[str]:
         """Get the most recent version tag."""
+        cwd = os.getcwd()
+        state = _git_state_key(cwd)
+        if state is None:
+            return _git_describe.__wrapped__(cwd, None)
+        return _git_describe(cwd, state)
+
+    def get_commits_between(self, from_ref: Optional[str], to_ref: str = "HEAD",
+                            include_merges: bool = False,
+                            with_stats: bool = True) -> List[CommitInfo]:
+        """Get commits between two refs with full metadata."""
+        return list(self.iter_commits_between(from_ref, to_ref, include_merges, with_stats))
+
+    def iter_commits_between(self, from_ref: Optional[str], to_ref: str = "HEAD",
+                             include_merges: bool = False,
+                             with_stats: bool = True) -> Iterator[CommitInfo]:
+        """Yield commits between two refs as ``git log`` produces them.
+
+        Uses a single ``git log --numstat`` call for all commits and their
+        line stats, and parses its output incrementally so the whole log is
+        never held in memory. Merge commits are filtered out by git unless
+        ``include_merges`` is set. With ``with_stats=False`` no diffs are
+        computed and the line/file counts stay at 0.
+        """
         try:
-            result = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0"],
-                capture_output=True, text=True, check=True
+            range_spec = to_ref
+            if from_ref and self._ref_exists(from_ref):
+                range_spec = f"{from_ref}..{to_ref}"
+
+            args = ["git", "log", f"--format={_LOG_FORMAT}"]
+            if with_stats:
+                args.append("--numstat")
+            if not include_merges:
+                args.append("--no-merges")
+
+            proc = subprocess.Popen(
+                [*args, range_spec, "--"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
             )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            # No tags exist
-            return None
+        except FileNotFoundError:
+            yield from self._get_commits_gitpython(from_ref, to_ref, include_merges, with_stats)
+            return
+
+        with proc:
+            reader = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace")
+            pending = ""
+            for chunk in iter(lambda: reader.read(_LOG_CHUNK_SIZE), ""):
+                records = (pending + chunk).split("\x1e")
+                # The last record may still be incomplete
+                pending = records.pop()
+                yield from self._parse_log_records(records)
+            yield from self._parse_log_records((pending,))
+
+    @staticmethod
+    def _ref_exists(ref: str) -> bool:
+        """Check whether a ref resolves to a commit."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            capture_output=True
+        )
+        return result.returncode == 0
 
-    def get_commits_between(self, from_ref: Optional[str], to_ref: str = "HEAD") -> List[CommitInfo]:
-        """Get commits between two refs with full metadata."""
+    @classmethod
+    def _parse_log_records(cls, records: Iterable[str]) -> Iterator[CommitInfo]:
+        """Parse complete log records, skipping empty or malformed ones."""
+        for record in records:
+            if not record:
+                continue
+            try:
+                yield cls._parse_log_record(record)
+            except ValueError:
+                # One unparsable record must not truncate the rest of the log
+                continue
+
+    @staticmethod
+    def _parse_log_record(record: str) -> CommitInfo:
+        """Parse one ``_LOG_FORMAT`` record followed by its numstat lines."""
+        header, _, numstat = record.partition("\x1d")
+        hexsha, author, email, date, message = header.split("\x1f", 4)
+
+        additions = deletions = files_changed = 0
+        for line in numstat.splitlines():
+            if not line:
+                continue
+            added, deleted, _ = line.split("\t", 2)
+            # Binary files report "-" for both counts
+            if added != "-":
+                additions += int(added)
+                deletions += int(deleted)
+            files_changed += 1
+
+        commit = CommitInfo.parse(
+            hexsha,
+            message,
+            datetime.fromisoformat(date),
+            author.replace('\\n', '').strip(),
+            email
+        )
+        commit.additions = additions
+        commit.deletions = deletions
+        commit.files_changed = files_changed
+        return commit
+
+    def _get_commits_gitpython(self, from_ref: Optional[str], to_ref: str = "HEAD",
+                               include_merges: bool = False,
+                               with_stats: bool = True) -> List[CommitInfo]:
+        """Fallback for get_commits_between when the git binary is unavailable."""
         try:
             from git import Repo
             repo = Repo(".")
@@ -173,25 +381,7 @@ class ChangelogPlugin(Plugin):
                 range_spec = to_ref
 
             commits = []
-            for commit in repo.iter_commits(range_spec):
-                # Get stats
-                stats = commit.stats.total
-
-                commits.append(CommitInfo(
-                    hash=commit.hexsha[:7],
-                    type="other",
-                    scope=None,
-                    message=commit.message.split('\n')[0].strip(),
-                    body='\n'.join(commit.message.split('\n')[1:]).strip() or None,
-                    date=commit.committed_datetime,
-                    author=commit.author.name.replace('\\n', '').strip(),
-                    email=commit.author.email,
-                    additions=stats.get('insertions', 0),
-                    deletions=stats.get('deletions', 0),
-                    files_changed=stats.get('files', 0)
-                ))
-
-                # Re-parse to extract type/scope
+            for commit in repo.iter_commits(range_spec, no_merges=not include_merges):
                 parsed = CommitInfo.parse(
                     commit.hexsha,
                     commit.message,
@@ -199,59 +389,100 @@ class ChangelogPlugin(Plugin):
                     commit.author.name.replace('\\n', '').strip(),
                     commit.author.email
                 )
-                commits[-1].type = parsed.type
-                commits[-1].scope = parsed.scope
-                commits[-1].message = parsed.message
+
+                if with_stats:
+                    stats = commit.stats.total
+                    parsed.additions = stats.get('insertions', 0)
+                    parsed.deletions = stats.get('deletions', 0)
+                    parsed.files_changed = stats.get('files', 0)
+                commits.append(parsed)
 
             return commits
 
         except Exception as e:
             return []
 
-    def deduplicate_commits(self, commits: List[CommitInfo]) -> List[CommitInfo]:
-        """Remove duplicate commits based on message similarity."""
-        seen_messages = {}
+    def analyze(self, commits: Iterable[CommitInfo]) -> "ChangelogAnalysis":
+        """Deduplicate, group and tally commits in a single pass.
+
+        Accepts any iterable (e.g. ``iter_commits_between``) so only unique
+        commits are kept in memory. ``total`` counts every commit read,
+        duplicates included; everything else covers unique commits only.
+        Merge commits only reach it when the caller passes them in, and
+        ``iter_commits_between`` leaves them out unless ``include_merges``.
+        """
+        seen_messages = set()
         unique_commits = []
+        by_type = {}
+        by_date = {}
+        author_data = {}
+        total = 0
 
         for commit in commits:
-            normalized = commit.normalized_message()
+            total += 1
 
-            # Skip merge commits
+            # Skip merge commits (git log already drops real merges; this
+            # also catches squashed "Merge ..." subjects)
             if commit.message.lower().startswith('merge'):
                 continue
 
-            if normalized not in seen_messages:
-                seen_messages[normalized] = commit
-                unique_commits.append(commit)
+            normalized = commit.normalized_message
+            if normalized in seen_messages:
+                continue
+            seen_messages.add(normalized)
+            unique_commits.append(commit)
+
+            by_type.setdefault(commit.type, []).append(commit)
+            by_date.setdefault(commit.date.strftime("%Y-%m-%d"), []).append(commit)
+
+            rec = author_data.get(commit.author)
+            if rec is None:
+                rec = author_data[commit.author] = [0, 0, 0, ""]
+            rec[0] += 1
+            rec[1] += commit.additions
+            rec[2] += commit.deletions
+            rec[3] = commit.email
+
+        return ChangelogAnalysis(
+            total=total,
+            unique=unique_commits,
+            by_type=by_type,
+            by_date=dict(sorted(by_date.items(), reverse=True)),
+            author_stats=self._build_author_stats(author_data, len(unique_commits))
+        )
 
-        return unique_commits
+    def deduplicate_commits(self, commits: Iterable[CommitInfo]) -> List[CommitInfo]:
+        """Remove duplicate commits based on message similarity."""
+        return self.analyze(commits).unique
 
     def calculate_author_stats(self, commits: List[CommitInfo]) -> List[AuthorStats]:
         """Calculate contribution statistics per author."""
-        author_data = defaultdict(lambda: {
-            'commits': 0,
-            'additions': 0,
-            'deletions': 0,
-            'email': ''
-        })
-
-        total_commits = len(commits)
+        # name -> [commits, additions, deletions, email]
+        author_data = {}
 
         for commit in commits:
-            author_data[commit.author]['commits'] += 1
-            author_data[commit.author]['additions'] += commit.additions
-            author_data[commit.author]['deletions'] += commit.deletions
-            author_data[commit.author]['email'] = commit.email
-
+            rec = author_data.get(commit.author)
+            if rec is None:
+                rec = author_data[commit.author] = [0, 0, 0, ""]
+            rec[0] += 1
+            rec[1] += commit.additions
+            rec[2] += commit.deletions
+            rec[3] = commit.email
+
+        return self._build_author_stats(author_data, len(commits))
+
+    @staticmethod
+    def _build_author_stats(author_data: Dict[str, list], total_commits: int) -> List[AuthorStats]:
+        """Turn ``[commits, additions, deletions, email]`` tallies into sorted AuthorStats."""
         stats = []
-        for name, data in author_data.items():
-            percentage = (data['commits'] / total_commits * 100) if total_commits > 0 else 0
+        for name, (commits, additions, deletions, email) in author_data.items():
+            percentage = (commits / total_commits * 100) if total_commits > 0 else 0
             stats.append(AuthorStats(
                 name=name,
-                email=data['email'],
-                commits=data['commits'],
-                additions=data['additions'],
-                deletions=data['deletions'],
+                email=email,
+                commits=commits,
+                additions=additions,
+                deletions=deletions,
                 percentage=round(percentage, 1)
             ))
 
@@ -263,9 +494,7 @@ class ChangelogPlugin(Plugin):
         """Group commits by their type."""
         grouped = {}
         for commit in commits:
-            if commit.type not in grouped:
-                grouped[commit.type] = []
-            grouped[commit.type].append(commit)
+            grouped.setdefault(commit.type, []).append(commit)
         return grouped
 
     def group_commits_by_date(self, commits: List[CommitInfo]) -> Dict[str, List[CommitInfo]]:
@@ -278,10 +507,10 @@ class ChangelogPlugin(Plugin):
         # Sort by date descending
         return dict(sorted(grouped.items(), reverse=True))
 
-    def format_commits_for_llm(self, commits: List[CommitInfo]) -> str:
-        """Format commits for LLM analysis."""
+    def format_commits_for_llm(self, commits: List[CommitInfo], max_lines: Optional[int] = None) -> str:
+        """Format commits for LLM analysis (at most ``max_lines`` of them)."""
         lines = []
-        for c in commits:
+        for c in islice(commits, max_lines):
             type_str = f"[{c.type}]" if c.type != "other" else ""
             scope_str = f"({c.scope})" if c.scope else ""
             lines.append(f"- {type_str}{scope_str} {c.message} (by {c.author}, {c.date.strftime('%Y-%m-%d')})")
@@ -290,26 +519,48 @@ class ChangelogPlugin(Plugin):
     def generate_llm_summary(self, commits: List[CommitInfo],
                             from_version: Optional[str],
                             to_version: str,
-                            language: str = "en") -> Optional[str]:
-        """Generate an LLM-powered summary of changes."""
+                            language: str = "en",
+                            config: Optional[dict] = None,
+                            grouped: Optional[Dict[str, List[CommitInfo]]] = None) -> Optional[str]:
+        """Generate an LLM-powered summary of changes.
+
+        ``config`` is the full RedGit config and ``grouped`` the commits
+        grouped by type; pass them when the caller already has them.
+        """
         try:
             from redgit.core.llm import LLMClient
-            from redgit.core.config import ConfigManager
 
-            config = ConfigManager().load()
+            if config is None:
+                config = self.full_config
             llm_config = config.get("llm", {})
             llm = LLMClient(llm_config)
 
-            commits_text = self.format_commits_for_llm(commits)
-
             # Group by type for context
-            grouped = self.group_commits_by_type(commits)
+            if grouped is None:
+                grouped = self.group_commits_by_type(commits)
+
+            max_commits = config.get("plugins", {}).get("changelog", {}).get(
+                "max_llm_commits", self.DEFAULT_MAX_LLM_COMMITS
+            )
+            if len(commits) > max_commits:
+                # Give every type a fair share of the prompt, newest first,
+                # and summarize the rest as counts
+                per_type = max(1, max_commits // len(grouped))
+                parts = []
+                for t, type_commits in grouped.items():
+                    parts.append(self.format_commits_for_llm(type_commits, per_type))
+                    if len(type_commits) > per_type:
+                        parts.append(f"- ... and {len(type_commits) - per_type:,} more {t} commits")
+                commits_text = '\n'.join(parts)
+            else:
+                commits_text = self.format_commits_for_llm(commits)
+
             type_summary = []
             for t in self.TYPE_ORDER:
-                if t in grouped:
-                    count = len(grouped[t])
+                type_commits = grouped.get(t)
+                if type_commits:
                     name, _ = self.TYPE_DISPLAY.get(t, (t, ""))
-                    type_summary.append(f"- {name}: {count}")
+                    type_summary.append(f"- {name}: {len(type_commits)}")
 
             language_name = {
                 "en": "English",
@@ -362,76 +613,60 @@ Output as markdown."""
     def generate_markdown(self, version: str, commits: List[CommitInfo],
                           from_version: Optional[str] = None,
                           llm_summary: Optional[str] = None,
-                          author_stats: Optional[List[AuthorStats]] = None) -> str:
+                          author_stats: Optional[List[AuthorStats]] = None,
+                          grouped: Optional[Dict[str, List[CommitInfo]]] = None) -> str:
         """Generate markdown changelog content."""
-        grouped = self.group_commits_by_type(commits)
+        if grouped is None:
+            grouped = self.group_commits_by_type(commits)
         date_str = datetime.now().strftime("%Y-%m-%d")
 
-        lines = [
-            f"# {version}",
-            "",
-            f"**Release Date:** {date_str}",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+
+        w(f"# {version}\n\n**Release Date:** {date_str}\n")
 
         if from_version:
-            lines.append(f"**Previous Version:** {from_version}")
+            w(f"**Previous Version:** {from_version}\n")
 
-        lines.extend([
-            f"**Total Commits:** {len(commits)}",
-            "",
-        ])
+        w(f"**Total Commits:** {len(commits)}\n\n")
 
         # Add LLM summary if available
         if llm_summary:
-            lines.extend([
-                "---",
-                "",
-                llm_summary,
-                "",
-            ])
+            w(f"---\n\n{llm_summary}\n\n")
 
         # Add raw commit list
-        lines.extend([
-            "---",
-            "",
-            "## Commit Details",
-            "",
-        ])
+        w("---\n\n## Commit Details\n\n")
 
+        headers = self._TYPE_HEADERS
         for commit_type in self.TYPE_ORDER:
-            if commit_type not in grouped:
+            type_commits = grouped.get(commit_type)
+            if not type_commits:
                 continue
 
-            type_commits = grouped[commit_type]
-            display_name, emoji = self.TYPE_DISPLAY.get(commit_type, (commit_type.title(), "📝"))
+            header = headers.get(commit_type) or f"### 📝 {commit_type.title()}"
 
-            lines.append(f"### {emoji} {display_name} ({len(type_commits)})")
-            lines.append("")
+            w(f"{header} ({len(type_commits)})\n\n")
 
             for commit in type_commits:
                 scope_str = f"**{commit.scope}:** " if commit.scope else ""
-                lines.append(f"- {scope_str}{commit.message} (`{commit.hash}`)")
+                w(f"- {scope_str}{commit.message} (`{commit.hash}`)\n")
 
-            lines.append("")
+            w("\n")
 
         # Add author statistics
         if author_stats:
-            lines.extend([
-                "---",
-                "",
-                "## Contributors",
-                "",
-            ])
+            w("---\n\n## Contributors\n\n")
 
             for stat in author_stats:
                 bar_length = int(stat.percentage / 5)  # 20 chars max for 100%
                 bar = "█" * bar_length + "░" * (20 - bar_length)
-                lines.append(f"- **{stat.name}**: {stat.commits} commits ({stat.percentage}%) `{bar}`")
-                lines.append(f"  - +{stat.additions} / -{stat.deletions} lines")
+                w(f"- **{stat.name}**: {stat.commits} commits ({stat.percentage}%) `{bar}`\n"
+                  f"  - +{stat.additions} / -{stat.deletions} lines\n")
 
-            lines.append("")
+            w("\n")
 
-        return "\n".join(lines)
+        # Every section ends with a blank line; drop its final newline
+        return buf.getvalue()[:-1]
 
     def save_version_changelog(self, version: str, content: str) -> Path:
         """Save changelog to version-specific file."""
@@ -440,31 +675,46 @@ Output as markdown."""
 
         version_name = version if version.startswith("v") else f"v{version}"
         filepath = output_dir / f"{version_name}.md"
-        filepath.write_text(content)
+        filepath.write_bytes(content.encode("utf-8"))
 
         return filepath
 
     def update_main_changelog(self, version: str, content: str) -> Path:
-        """Prepend to main CHANGELOG.md file."""
+        """Prepend to main CHANGELOG.md file.
+
+        The existing changelog is streamed into a temporary file behind the
+        new entry and swapped in atomically, so it is never read into memory.
+        """
         changelog_path = Path("CHANGELOG.md")
 
-        lines = content.split("\n")
-        version_content = "\n".join(lines)
-
-        if changelog_path.exists():
-            existing = changelog_path.read_text()
-            if existing.startswith("# Changelog"):
-                parts = existing.split("\n", 2)
-                if len(parts) >= 2:
-                    new_content = f"{parts[0]}\n{parts[1]}\n\n{version_content}\n\n---\n\n"
-                    if len(parts) > 2:
-                        new_content += parts[2]
+        if not changelog_path.exists():
+            changelog_path.write_bytes(f"# Changelog\n\n{content}\n".encode("utf-8"))
+            return changelog_path
+
+        entry = content.encode("utf-8")
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=changelog_path.parent, prefix=".CHANGELOG.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp, open(changelog_path, "rb") as old:
+                first_line = old.readline()
+                if first_line.startswith(b"# Changelog"):
+                    if first_line.endswith(b"\n"):
+                        # Keep the title and the line after it, then insert the entry
+                        second_line = old.readline()
+                        if second_line.endswith(b"\n"):
+                            second_line = second_line[:-1]
+                        tmp.write(first_line + second_line + b"\n\n" + entry + b"\n\n---\n\n")
+                    else:
+                        tmp.write(first_line + b"\n\n" + entry + b"\n")
                 else:
-                    new_content = f"{parts[0]}\n\n{version_content}\n"
-            else:
-                new_content = f"# Changelog\n\n{version_content}\n\n---\n\n{existing}"
-        else:
-            new_content = f"# Changelog\n\n{version_content}\n"
+                    tmp.write(b"# Changelog\n\n" + entry + b"\n\n---\n\n" + first_line)
+                shutil.copyfileobj(old, tmp, 1 << 20)
+
+            shutil.copymode(changelog_path, tmp.name)
+            os.replace(tmp.name, changelog_path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
 
-        changelog_path.write_text(new_content)
-        return changelog_path
\ No newline at end of file
+        return changelog_path
@@ -8,6 +8,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from pathlib import Path
+from typing import Optional
 
 console = Console()
 
@@ -31,11 +32,12 @@ def get_plugin():
     return module.ChangelogPlugin()
 
 
-def get_language_from_config() -> str:
-    """Get changelog language from config."""
+def get_language_from_config(config: Optional[dict] = None) -> str:
+    """Get changelog language from config (loaded if not given)."""
     try:
-        from redgit.core.config import ConfigManager
-        config = ConfigManager().load()
+        if config is None:
+            from redgit.core.config import ConfigManager
+            config = ConfigManager().load()
         # Check daily.language or changelog.language
         lang = config.get("plugins", {}).get("changelog", {}).get("language")
         if not lang:
@@ -75,14 +77,15 @@ def generate_cmd(
     """Generate changelog for a version with AI-powered summary."""
     plugin = get_plugin()
 
+    # Load the config once and share it with every step below
+    try:
+        config = plugin.full_config
+    except Exception:
+        config = {}
+
     # Get version from version plugin if not specified
     if not version:
-        try:
-            from redgit.core.config import ConfigManager
-            config = ConfigManager().load()
-            version = config.get("plugins", {}).get("version", {}).get("current", "1.0.0")
-        except Exception:
-            version = "1.0.0"
+        version = config.get("plugins", {}).get("version", {}).get("current", "1.0.0")
 
     # Determine from_ref
     # Empty string means "all commits"
@@ -102,40 +105,39 @@ def generate_cmd(
     console.print(f"[cyan]Generating changelog for version {version}[/cyan]")
     console.print(f"[dim]Range: {from_ref_display} → {to_ref}[/dim]")
 
-    # Fetch commits
+    # Stream commits through deduplication, grouping and contributor stats in one pass
     with console.status("Fetching commits..."):
-        commits = plugin.get_commits_between(from_ref, to_ref)
+        analysis = plugin.analyze(plugin.iter_commits_between(from_ref, to_ref, with_stats=True))
+
+    original_count = analysis.total
+    commits = analysis.unique
+    author_stats = analysis.author_stats
+    grouped = analysis.by_type
 
-    if not commits:
+    if not original_count:
         console.print("[yellow]No commits found for changelog.[/yellow]")
         return
 
-    original_count = len(commits)
-    console.print(f"[dim]Found {original_count} commits[/dim]")
-
-    # Deduplicate
-    with console.status("Removing duplicates..."):
-        commits = plugin.deduplicate_commits(commits)
+    # Commits are read with --no-merges, so merge commits are not part of the count
+    console.print(f"[dim]Found {original_count} commits (merges excluded)[/dim]")
 
     if len(commits) < original_count:
         console.print(f"[dim]After deduplication: {len(commits)} unique commits[/dim]")
 
-    # Calculate author stats
-    with console.status("Calculating contributor statistics..."):
-        author_stats = plugin.calculate_author_stats(commits)
-
     # Generate LLM summary
     llm_summary = None
     if not no_ai:
         # Use command-line lang if provided, otherwise fall back to config
-        language = lang if lang else get_language_from_config()
+        language = lang if lang else get_language_from_config(config)
         console.print(f"[cyan]Generating AI summary ({language})...[/cyan]")
         with console.status("AI is analyzing commits..."):
             llm_summary = plugin.generate_llm_summary(
                 commits,
                 from_ref,
                 version,
-                language
+                language,
+                config=config,
+                grouped=grouped
             )
 
         if llm_summary:
@@ -149,7 +151,8 @@ def generate_cmd(
         commits,
         from_ref,
         llm_summary,
-        author_stats
+        author_stats,
+        grouped=grouped
     )
 
     # Save version-specific file
@@ -162,14 +165,13 @@ def generate_cmd(
         console.print(f"[green]Updated {main_file}[/green]")
 
     # Show summary table
-    grouped = plugin.group_commits_by_type(commits)
     table = Table(title="Changelog Summary", show_header=True)
     table.add_column("Type", style="cyan")
     table.add_column("Count", style="green", justify="right")
 
     for commit_type in plugin.TYPE_ORDER:
-        if commit_type in grouped:
-            type_commits = grouped[commit_type]
+        type_commits = grouped.get(commit_type)
+        if type_commits:
             display_name, emoji = plugin.TYPE_DISPLAY.get(commit_type, (commit_type, ""))
             table.add_row(f"{emoji} {display_name}", str(len(type_commits)))
 
@@ -15,7 +15,7 @@ Also available as shortcuts:
 import re
 import json
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, NamedTuple
 from dataclasses import dataclass
 
 try:
@@ -70,6 +70,13 @@ class VersionInfo:
             raise ValueError(f"Invalid bump level: {level}")
 
 
+class VersionState(NamedTuple):
+    """Everything a version change needs, gathered in one pass."""
+    current: Optional[VersionInfo]
+    files: Optional[List[Tuple[Path, str]]]
+    config: dict
+
+
 class VersionPlugin(Plugin):
     """Version management plugin with semantic versioning support."""
 
@@ -91,15 +98,34 @@ class VersionPlugin(Plugin):
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
+        self._full_config = None
         self._config = None
 
+    @property
+    def full_config(self) -> dict:
+        """Full RedGit config, loaded once per plugin instance."""
+        if self._full_config is None:
+            self._full_config = self.config_manager.load()
+        return self._full_config
+
     @property
     def config(self) -> dict:
         if self._config is None:
-            full_config = self.config_manager.load()
-            self._config = full_config.get("plugins", {}).get("version", {})
+            self._config = self.full_config.get("plugins", {}).get("version", {})
         return self._config
 
+    def load_state(self, scan_files: bool = True) -> VersionState:
+        """
+        Load the config and scan version files once for a version change.
+
+        Args:
+            scan_files: Scan the project for version files. When False,
+                ``files`` is None and files are only read if the config
+                has no current version.
+        """
+        files = self.get_version_files() if scan_files else None
+        return VersionState(self.get_current_version(files), files, self.full_config)
+
     def match(self) -> bool:
         """Check if version plugin is enabled or can be used."""
         # Always available if any version file exists
@@ -128,8 +154,13 @@ class VersionPlugin(Plugin):
 
         return None
 
-    def get_current_version(self) -> Optional[VersionInfo]:
-        """Get current version from config or detect from files."""
+    def get_current_version(self, files: Optional[List[Tuple[Path, str]]] = None) -> Optional[VersionInfo]:
+        """
+        Get current version from config or detect from files.
+
+        Args:
+            files: Result of get_version_files(), if already scanned
+        """
         # First check config
         config_version = self.config.get("current")
         if config_version:
@@ -138,8 +169,11 @@ class VersionPlugin(Plugin):
             except ValueError:
                 pass
 
-        # Detect from files
-        file_info = self.detect_version_file()
+        # Detect from files (the first version file is the detected one)
+        if files is not None:
+            file_info = files[0] if files else None
+        else:
+            file_info = self.detect_version_file()
         if not file_info:
             return None
 
@@ -204,11 +238,15 @@ class VersionPlugin(Plugin):
             return False
 
     def update_all_versions(self, old_version: VersionInfo,
-                           new_version: VersionInfo) -> List[str]:
-        """Update version in all detected files."""
+                           new_version: VersionInfo,
+                           files: Optional[List[Tuple[Path, str]]] = None) -> List[str]:
+        """Update version in all detected files (or the given ones)."""
         updated_files = []
 
-        for filepath, pattern in self.get_version_files():
+        if files is None:
+            files = self.get_version_files()
+
+        for filepath, pattern in files:
             if self.update_version_in_file(
                 filepath, pattern, str(old_version), str(new_version)
             ):
@@ -216,9 +254,10 @@ class VersionPlugin(Plugin):
 
         return updated_files
 
-    def save_version_to_config(self, version: VersionInfo):
-        """Save current version to config."""
-        config = self.config_manager.load()
+    def save_version_to_config(self, version: VersionInfo, config: Optional[dict] = None):
+        """Save current version to config (``config`` is the loaded full config, if at hand)."""
+        if config is None:
+            config = self.full_config
         if "plugins" not in config:
             config["plugins"] = {}
         if "version" not in config["plugins"]:
@@ -227,6 +266,8 @@ class VersionPlugin(Plugin):
         config["plugins"]["version"]["current"] = str(version)
         config["plugins"]["version"]["enabled"] = True
         self.config_manager.save(config)
+        self._full_config = config
+        self._config = None
 
     def get_tag_prefix(self) -> str:
         """Get git tag prefix from config."""
@@ -240,8 +281,7 @@ class VersionPlugin(Plugin):
 
     def is_changelog_enabled(self) -> bool:
         """Check if changelog plugin is enabled."""
-        config = self.config_manager.load()
-        plugins_config = config.get("plugins", {})
+        plugins_config = self.full_config.get("plugins", {})
         # Check enabled list first
         enabled_list = plugins_config.get("enabled", [])
         if "changelog" in enabled_list:
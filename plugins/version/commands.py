@@ -3,14 +3,23 @@ Version plugin CLI commands.
 """
 
 import subprocess
+import threading
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
 from pathlib import Path
+from typing import List, Tuple
 
-console = Console()
+_console = None
+
+_LEVELS = frozenset(("patch", "minor", "major"))
+
+# Tags shown by `rg version list`
+_LIST_LIMIT = 20
+
+_CHANGELOG_COMMANDS_PATH = Path(__file__).parent.parent / "changelog" / "commands.py"
+
+_plugin_classes = None
+_changelog_commands = None
+_changelog_lock = threading.Lock()
 
 version_app = typer.Typer(
     name="version",
@@ -19,23 +28,107 @@ version_app = typer.Typer(
 )
 
 
-def get_plugin():
-    """Get the version plugin instance."""
+def _get_console():
+    """Create the Rich console on first use (keeps rich off the import path)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _load_module(name: str, path: Path):
+    """Load a plugin module from a file path."""
     import importlib.util
-    from pathlib import Path
 
-    # Load the __init__.py from the same directory
-    init_path = Path(__file__).parent / "__init__.py"
-    spec = importlib.util.spec_from_file_location("version_plugin", init_path)
+    spec = importlib.util.spec_from_file_location(name, path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    return module
 
-    return module.VersionPlugin(), module.VersionInfo
+
+def get_plugin():
+    """Get the version plugin instance (its module is loaded once per process)."""
+    global _plugin_classes
+    if _plugin_classes is None:
+        try:
+            # Regular import when loaded as part of the plugins package
+            from . import VersionPlugin, VersionInfo
+        except ImportError:
+            # Loaded standalone: load the __init__.py from the same directory
+            module = _load_module("version_plugin", Path(__file__).parent / "__init__.py")
+            VersionPlugin, VersionInfo = module.VersionPlugin, module.VersionInfo
+        _plugin_classes = (VersionPlugin, VersionInfo)
+
+    VersionPlugin, VersionInfo = _plugin_classes
+    return VersionPlugin(), VersionInfo
+
+
+def _get_changelog_commands():
+    """Get the changelog plugin's commands module, or None if it isn't installed."""
+    global _changelog_commands
+    with _changelog_lock:
+        if _changelog_commands is None:
+            try:
+                from ..changelog import commands as changelog_commands
+            except ImportError:
+                if _CHANGELOG_COMMANDS_PATH.exists():
+                    changelog_commands = _load_module("changelog_commands", _CHANGELOG_COMMANDS_PATH)
+                else:
+                    # Remember the miss so the path is only checked once
+                    changelog_commands = False
+            _changelog_commands = changelog_commands
+    return _changelog_commands or None
+
+
+def _tag_patterns(tag_prefix: str) -> List[str]:
+    """for-each-ref patterns matching the same tags as `git tag -l "<prefix>*"`."""
+    return [f"refs/tags/{tag_prefix}*", f"refs/tags/{tag_prefix}*/**"]
+
+
+def _create_tags(tags: List[Tuple[str, str]], push: bool = False):
+    """
+    Create annotated tags and optionally push them.
+
+    All tags are pushed with a single atomic ``git push``, so a batch of
+    release tags costs one network round trip and lands all-or-nothing.
+
+    Args:
+        tags: (tag_name, message) pairs
+        push: Push the created tags to origin
+
+    Raises:
+        subprocess.CalledProcessError: If creating or pushing a tag fails
+    """
+    console = _get_console()
+
+    for tag_name, message in tags:
+        subprocess.run(
+            ["git", "tag", "-a", tag_name, "-m", message],
+            check=True,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace"
+        )
+        console.print(f"[green]Created tag: {tag_name}[/green]")
+
+    if push and tags:
+        console.print(f"[cyan]Pushing tag to remote...[/cyan]")
+        subprocess.run(
+            ["git", "push", "--atomic", "origin", *(f"refs/tags/{tag_name}" for tag_name, _ in tags)],
+            check=True,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace"
+        )
+        for tag_name, _ in tags:
+            console.print(f"[green]Pushed tag: {tag_name}[/green]")
 
 
 @version_app.command("show")
 def show_cmd():
     """Show current version."""
+    console = _get_console()
     plugin, _ = get_plugin()
 
     current = plugin.get_current_version()
@@ -60,6 +153,9 @@ def init_cmd(
     ),
 ):
     """Initialize versioning for the project."""
+    from rich.prompt import Prompt, Confirm
+
+    console = _get_console()
     plugin, VersionInfo = get_plugin()
 
     # Check if already initialized
@@ -101,6 +197,7 @@ def set_cmd(
     ),
 ):
     """Set a specific version."""
+    console = _get_console()
     plugin, VersionInfo = get_plugin()
 
     try:
@@ -109,18 +206,20 @@ def set_cmd(
         console.print(f"[red]Invalid version format: {version}[/red]")
         raise typer.Exit(1)
 
-    old_ver = plugin.get_current_version()
+    # Only scan the project when files are going to be updated
+    state = plugin.load_state(scan_files=update_files)
+    old_ver = state.current
 
     # Update files if requested
     if update_files and old_ver:
-        updated = plugin.update_all_versions(old_ver, new_ver)
+        updated = plugin.update_all_versions(old_ver, new_ver, state.files)
         if updated:
             console.print("[green]Updated files:[/green]")
             for f in updated:
                 console.print(f"  [dim]- {f}[/dim]")
 
     # Save to config
-    plugin.save_version_to_config(new_ver)
+    plugin.save_version_to_config(new_ver, state.config)
     console.print(f"[green]Version set: {new_ver}[/green]")
 
 
@@ -141,15 +240,25 @@ def release_cmd(
     ),
 ):
     """Release a new version by bumping the specified level."""
-    plugin, VersionInfo = get_plugin()
+    _do_release(level, tag=tag, push=push, changelog=changelog)
 
-    if level not in ["patch", "minor", "major"]:
+
+def _do_release(level: str, tag: bool = True, push: bool = False, changelog: bool = True):
+    """Bump, tag and optionally changelog a release (shared by `version release` and `rg release`)."""
+    from rich.panel import Panel
+
+    console = _get_console()
+
+    if level not in _LEVELS:
         console.print(f"[red]Invalid level: {level}[/red]")
         console.print("[dim]Use: patch, minor, or major[/dim]")
         raise typer.Exit(1)
 
+    plugin, VersionInfo = get_plugin()
+
     # Get current version
-    current = plugin.get_current_version()
+    state = plugin.load_state()
+    current = state.current
     if not current:
         console.print("[yellow]No version found. Run 'rg version init' first.[/yellow]")
         raise typer.Exit(1)
@@ -160,7 +269,7 @@ def release_cmd(
     console.print(f"[cyan]Bumping version: {current} -> {new_version}[/cyan]")
 
     # Update all files
-    updated = plugin.update_all_versions(current, new_version)
+    updated = plugin.update_all_versions(current, new_version, state.files)
     if updated:
         console.print("\n[green]Updated files:[/green]")
         for f in updated:
@@ -169,7 +278,7 @@ def release_cmd(
         console.print("[yellow]No version files were updated.[/yellow]")
 
     # Save to config
-    plugin.save_version_to_config(new_version)
+    plugin.save_version_to_config(new_version, state.config)
 
     # Generate changelog if enabled
     if changelog and plugin.is_changelog_enabled():
@@ -180,13 +289,8 @@ def release_cmd(
             from_tag = f"{tag_prefix}{current}"
 
             # Import changelog plugin commands
-            changelog_commands_path = Path(__file__).parent.parent / "changelog" / "commands.py"
-            if changelog_commands_path.exists():
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("changelog_commands", changelog_commands_path)
-                changelog_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(changelog_module)
-
+            changelog_module = _get_changelog_commands()
+            if changelog_module:
                 # Call generate with the from_tag
                 changelog_module.generate_cmd(
                     version=str(new_version),
@@ -202,24 +306,9 @@ def release_cmd(
         tag_name = f"{plugin.get_tag_prefix()}{new_version}"
         console.print(f"\n[cyan]Creating tag: {tag_name}[/cyan]")
         try:
-            subprocess.run(
-                ["git", "tag", "-a", tag_name, "-m", f"Release {new_version}"],
-                check=True,
-                capture_output=True
-            )
-            console.print(f"[green]Created tag: {tag_name}[/green]")
-
-            if push:
-                console.print(f"[cyan]Pushing tag to remote...[/cyan]")
-                subprocess.run(
-                    ["git", "push", "origin", tag_name],
-                    check=True,
-                    capture_output=True
-                )
-                console.print(f"[green]Pushed tag: {tag_name}[/green]")
-
+            _create_tags([(tag_name, f"Release {new_version}")], push=push)
         except subprocess.CalledProcessError as e:
-            console.print(f"[yellow]Failed to create/push tag: {e.stderr.decode() if e.stderr else str(e)}[/yellow]")
+            console.print(f"[yellow]Failed to create/push tag: {e.stderr or e}[/yellow]")
 
     # Summary
     console.print(Panel(
@@ -244,6 +333,10 @@ def current_cmd(
     ),
 ):
     """Release current version without bumping (tag + changelog only)."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    console = _get_console()
     plugin, _ = get_plugin()
 
     # Get current version
@@ -278,24 +371,20 @@ def current_cmd(
     if changelog and plugin.is_changelog_enabled():
         console.print("\n[cyan]Generating changelog...[/cyan]")
         try:
-            # Find previous tag
+            # Find previous tag (the newest two are enough to skip the current one)
             result = subprocess.run(
-                ["git", "tag", "-l", f"{tag_prefix}*", "--sort=-version:refname"],
+                ["git", "for-each-ref", "--sort=-v:refname", "--count=2",
+                 "--format=%(refname:strip=2)", *_tag_patterns(tag_prefix)],
                 capture_output=True,
                 text=True,
                 check=True
             )
-            tags = [t for t in result.stdout.strip().split("\n") if t and t != current_tag]
+            tags = [t for t in result.stdout.split() if t != current_tag]
             from_tag = tags[0] if tags else None
 
             # Import changelog plugin commands
-            changelog_commands_path = Path(__file__).parent.parent / "changelog" / "commands.py"
-            if changelog_commands_path.exists():
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("changelog_commands", changelog_commands_path)
-                changelog_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(changelog_module)
-
+            changelog_module = _get_changelog_commands()
+            if changelog_module:
                 # Call generate with the from_tag
                 changelog_module.generate_cmd(
                     version=str(current),
@@ -310,24 +399,9 @@ def current_cmd(
     if tag:
         console.print(f"\n[cyan]Creating tag: {current_tag}[/cyan]")
         try:
-            subprocess.run(
-                ["git", "tag", "-a", current_tag, "-m", f"Release {current}"],
-                check=True,
-                capture_output=True
-            )
-            console.print(f"[green]Created tag: {current_tag}[/green]")
-
-            if push:
-                console.print(f"[cyan]Pushing tag to remote...[/cyan]")
-                subprocess.run(
-                    ["git", "push", "origin", current_tag],
-                    check=True,
-                    capture_output=True
-                )
-                console.print(f"[green]Pushed tag: {current_tag}[/green]")
-
+            _create_tags([(current_tag, f"Release {current}")], push=push)
         except subprocess.CalledProcessError as e:
-            console.print(f"[yellow]Failed to create/push tag: {e.stderr.decode() if e.stderr else str(e)}[/yellow]")
+            console.print(f"[yellow]Failed to create/push tag: {e.stderr or e}[/yellow]")
 
     # Summary
     console.print(Panel(
@@ -339,19 +413,25 @@ def current_cmd(
 @version_app.command("list")
 def list_cmd():
     """List version tags from git history."""
+    from rich.table import Table
+
+    console = _get_console()
     plugin, _ = get_plugin()
     tag_prefix = plugin.get_tag_prefix()
 
+    patterns = _tag_patterns(tag_prefix)
+
     try:
+        # Let git sort and limit; one extra row tells us whether there are more
         result = subprocess.run(
-            ["git", "tag", "-l", f"{tag_prefix}*", "--sort=-version:refname"],
+            ["git", "for-each-ref", "--sort=-v:refname", f"--count={_LIST_LIMIT + 1}",
+             "--format=%(refname:strip=2)", *patterns],
             capture_output=True,
             text=True,
             check=True
         )
 
-        tags = result.stdout.strip().split("\n")
-        tags = [t for t in tags if t]
+        tags = result.stdout.split()
 
         if not tags:
             console.print("[yellow]No version tags found.[/yellow]")
@@ -361,12 +441,18 @@ def list_cmd():
         table.add_column("Version", style="cyan")
         table.add_column("Tag", style="dim")
 
-        for tag in tags[:20]:  # Limit to 20
-            version = tag.lstrip(tag_prefix)
+        for tag in tags[:_LIST_LIMIT]:
+            version = tag.removeprefix(tag_prefix)
             table.add_row(version, tag)
 
-        if len(tags) > 20:
-            table.add_row("...", f"and {len(tags) - 20} more")
+        if len(tags) > _LIST_LIMIT:
+            # Count the rest line by line instead of buffering every tag
+            with subprocess.Popen(
+                ["git", "for-each-ref", "--format=", *patterns],
+                stdout=subprocess.PIPE
+            ) as proc:
+                total = sum(1 for _ in proc.stdout)
+            table.add_row("...", f"and {total - _LIST_LIMIT} more")
 
         console.print(table)
 
@@ -387,7 +473,7 @@ def release_callback(ctx: typer.Context):
     """Release a new version. Defaults to patch bump if no subcommand given."""
     if ctx.invoked_subcommand is None:
         # Default behavior: patch release
-        release_cmd(level="patch", tag=True, push=False, changelog=True)
+        _do_release("patch", tag=True, push=False, changelog=True)
 
 
 @release_app.command("current")
@@ -407,7 +493,7 @@ def release_patch_cmd(
     changelog: bool = typer.Option(True, "--changelog/--no-changelog", help="Generate changelog"),
 ):
     """Release with patch version bump (x.x.X)."""
-    release_cmd(level="patch", tag=tag, push=push, changelog=changelog)
+    _do_release("patch", tag=tag, push=push, changelog=changelog)
 
 
 @release_app.command("minor")
@@ -417,7 +503,7 @@ def release_minor_cmd(
     changelog: bool = typer.Option(True, "--changelog/--no-changelog", help="Generate changelog"),
 ):
     """Release with minor version bump (x.X.0)."""
-    release_cmd(level="minor", tag=tag, push=push, changelog=changelog)
+    _do_release("minor", tag=tag, push=push, changelog=changelog)
 
 
 @release_app.command("major")
@@ -427,4 +513,4 @@ def release_major_cmd(
     changelog: bool = typer.Option(True, "--changelog/--no-changelog", help="Generate changelog"),
 ):
     """Release with major version bump (X.0.0)."""
-    release_cmd(level="major", tag=tag, push=push, changelog=changelog)
\ No newline at end of file
+    _do_release("major", tag=tag, push=push, changelog=changelog)
\ No newline at end of file